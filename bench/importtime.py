@@ -0,0 +1,74 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measures the time to import the curves package and look up curves.
+
+Each scenario runs in fresh interpreters, timed from before the package is
+imported; the median time and the curve modules loaded are reported. For a
+per-module breakdown of the initial import, use python -X importtime.
+
+Usage: python bench/importtime.py [RUNS]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = (
+    ("import", "import rubenesque.curves as c"),
+    ("find P-256", "import rubenesque.curves as c; c.find('P-256')"),
+    ("find Ed25519", "import rubenesque.curves as c; c.find('Ed25519')"),
+    ("supported", "import rubenesque.curves as c; c.supported()"),
+    ("all curves", "import rubenesque.curves as c; [c.find(n) for n in c.supported()]"),
+)
+
+TEMPLATE = """
+import json, sys, time
+t = time.perf_counter()
+%s
+t = time.perf_counter() - t
+print(json.dumps([t, sorted(m for m in sys.modules if m.startswith("rubenesque.curves."))]))
+"""
+
+
+def measure(code):
+    "Returns the seconds taken by code and the curve modules it loaded"
+    out = subprocess.check_output([sys.executable, "-c", TEMPLATE % code])
+    return json.loads(out)
+
+
+def main(runs=15):
+    for name, code in SCENARIOS:
+        samples = [measure(code) for i in range(runs)]
+        t = statistics.median(s[0] for s in samples)
+        modules = [m.rsplit('.', 1)[-1] for m in samples[0][1]]
+        print("%-14s %8.2f ms  %s" % (name, t * 1000, " ".join(modules)))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,58 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compares ECDSA signing throughput with random and RFC 6979 nonces, the
+latter with and without the setup kept by an ecdsa.SigningKey.
+
+Usage: python bench/nonce.py [CURVE] [COUNT]
+"""
+
+import hashlib
+import sys
+import timeit
+
+from rubenesque.curves import find
+from rubenesque.signatures import ecdsa
+
+
+def main(curve="secp256r1", count=50):
+    cls = find(curve)
+    key = ecdsa.SigningKey(cls)
+    hsh = hashlib.sha256(b'rubenesque').digest()
+
+    cases = (
+        ("urandom", key.private, {}),
+        ("rfc6979", key.private, {"hashfunc": hashlib.sha256}),
+        ("rfc6979k", key, {"hashfunc": hashlib.sha256}),
+    )
+    for name, prv, kwargs in cases:
+        t = timeit.timeit(lambda: ecdsa.sign(cls, prv, hsh, **kwargs), number=count)
+        print("%-10s %-8s %8.1f sign/s" % (curve, name, count / t))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(a) for a in sys.argv[2:3]])
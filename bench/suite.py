@@ -0,0 +1,220 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Benchmarks the curve arithmetic, codecs, signatures and field operations.
+
+Every curve in curves.supported() is measured for point addition, doubling,
+scalar and fixed-base multiplication, each codec's encode and decode,
+ECDSA (Weierstrass curves) or EdDSA (RFC 8032 curves) signing and
+verification, and field inversion and square root. Results are the best
+time per operation, in seconds, over several repeats.
+
+Results are written as JSON together with the environment they were
+measured in. Given a baseline file, benchmarks which got slower than the
+threshold allows are reported and the exit status is 1.
+
+Usage: python bench/suite.py [-o OUT] [-b BASELINE] [-t THRESHOLD]
+                             [--limit PATTERN=THRESHOLD ...] [-k PATTERN]
+                             [--repeat N] [--min-time SECONDS]
+"""
+
+import argparse
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+from rubenesque import curves
+from rubenesque.codecs import sec, cfrg, jwk
+from rubenesque.curves import edwards, weierstrass
+from rubenesque.math import inv, sqrt
+from rubenesque.signatures import ecdsa, eddsa
+
+
+def cases(cls):
+    "Yields the (name, function) benchmarks of a curve"
+    g = cls.generator()
+    k = cls.private_key()
+    p = g * cls.private_key()
+    q = g * cls.private_key()
+    cls.precompute()
+
+    yield "add", lambda: p + q
+    yield "double", lambda: p.double()
+    yield "multiply", lambda: p * k
+    yield "base_multiply", lambda: cls.base_multiply(k)
+
+    for name, enc, dec in (
+            ("sec", sec.encode, lambda d: sec.decode(cls, d)),
+            ("sec_uncompressed", lambda x: sec.encode(x, False),
+             lambda d: sec.decode(cls, d)),
+            ("cfrg", cfrg.encode, lambda d: cfrg.decode(cls, d)),
+            ("jwk", jwk.encode, jwk.decode)):
+        data = enc(p)
+        yield "encode_" + name, lambda enc=enc: enc(p)
+        yield "decode_" + name, lambda dec=dec, data=data: dec(data)
+
+    if issubclass(cls, weierstrass.Point):
+        hsh = hashlib.sha256(b'rubenesque').digest()
+        pub = g * k
+        r, s = ecdsa.sign(cls, k, hsh)
+        yield "ecdsa_sign", lambda: ecdsa.sign(cls, k, hsh)
+        yield "ecdsa_verify", lambda: ecdsa.verify(pub, hsh, r, s)
+    elif issubclass(cls, edwards.Point) and cls in eddsa.HASHES:
+        key = eddsa.SigningKey(cls)
+        sig = eddsa.sign(key, b'rubenesque')
+        yield "eddsa_sign", lambda: eddsa.sign(key, b'rubenesque')
+        yield "eddsa_verify", lambda: eddsa.verify(key.public, b'rubenesque', sig)
+
+    n = p.x
+    yield "inv", lambda: inv(n, cls.prime)
+    yield "sqrt", lambda: sqrt(n * n % cls.prime, cls.prime, cls.context().sqrt_plan)
+
+
+def measure(func, repeat, min_time):
+    "Returns the best seconds per call of func"
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        t = timer.timeit(number)
+        if t >= min_time:
+            break
+        number *= 2 if t == 0 else max(2, int(min_time / t * 1.2))
+
+    return min([t] + timer.repeat(repeat - 1, number)) / number
+
+
+def environment():
+    "Describes the machine and the code being measured"
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def run(pattern="*", repeat=5, min_time=0.05, out=sys.stderr):
+    "Runs the benchmarks whose curve/name matches pattern"
+    # Curves the pattern excludes are skipped before their setup runs.
+    curve = pattern.split("/")[0] if "/" in pattern else "*"
+
+    results = {}
+    for name in curves.supported():
+        if not fnmatch.fnmatch(name, curve):
+            continue
+
+        cls = curves.find(name)
+        for case, func in cases(cls):
+            key = "%s/%s" % (name, case)
+            if fnmatch.fnmatch(key, pattern):
+                results[key] = measure(func, repeat, min_time)
+                print("%-40s %12.1f us" % (key, results[key] * 1e6), file=out)
+    return results
+
+
+def compare(results, baseline, threshold=0.1, limits=()):
+    """Returns the (name, baseline, result, ratio) of each regression
+
+    A benchmark regressed if it takes more than 1 + threshold times its
+    baseline. limits is a list of (pattern, threshold) overriding the
+    threshold of the matching benchmarks; the last match wins.
+    """
+    regressions = []
+    for key in sorted(set(results) & set(baseline)):
+        limit = threshold
+        for pattern, value in limits:
+            if fnmatch.fnmatch(key, pattern):
+                limit = value
+
+        ratio = results[key] / baseline[key]
+        if ratio > 1 + limit:
+            regressions.append((key, baseline[key], results[key], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("-b", "--baseline", help="compare with a JSON file")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1,
+                        help="allowed slowdown ratio (default 0.1)")
+    parser.add_argument("--limit", action="append", default=[],
+                        metavar="PATTERN=THRESHOLD",
+                        help="threshold for benchmarks matching PATTERN")
+    parser.add_argument("-k", "--pattern", default="*",
+                        help="only run benchmarks matching curve/name")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="seconds per measurement")
+    args = parser.parse_args(argv)
+
+    limits = []
+    for limit in args.limit:
+        pattern, value = limit.rsplit("=", 1)
+        limits.append((pattern, float(value)))
+
+    results = run(args.pattern, args.repeat, args.min_time)
+    document = {"environment": environment(), "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = compare(results, baseline, args.threshold, limits)
+    for key, old, new, ratio in regressions:
+        print("REGRESSION %-40s %10.1f -> %10.1f us (%+.0f%%)"
+              % (key, old * 1e6, new * 1e6, (ratio - 1) * 100))
+    print("%d benchmarks compared, %d regressions"
+          % (len(set(results) & set(baseline)), len(regressions)))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -52,6 +52,7 @@ Rubenesque currently implements the following curves:
  * brainpoolP320r1
  * brainpoolP384r1
  * brainpoolP512r1
+ * ed448goldilocks
  * edwards25519
  * edwards448
  * MDC201601
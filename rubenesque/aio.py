@@ -0,0 +1,249 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+An asyncio interface to signing, verification, ECDH and decoding.
+
+Each operation runs in an executor (threads by default, or any
+concurrent.futures executor such as a process pool), so it does not block
+the event loop. Requests of the same kind which arrive within a short
+window are coalesced into a single batch job. Semaphores bound the number
+of batch jobs running at once and the number of outstanding requests.
+
+>>> import asyncio
+>>> from hashlib import sha256
+>>> from .curves.sec import secp256r1
+>>> from .codecs import sec
+
+>>> async def main():
+...     prv = secp256r1.private_key()
+...     pub = secp256r1.generator() * prv
+...     h = sha256(b'abc').digest()
+...     r, s = await sign(secp256r1, prv, h, hashfunc=sha256)
+...     ok = await asyncio.gather(verify(pub, h, r, s), verify(pub, h, s, r))
+...     peer = await decode(secp256r1, sec.encode(pub))
+...     secret = await ecdh(secp256r1, 3, sec.encode(pub))
+...     return ok, peer == pub, secret == sec.encode(pub * 3)[1:]
+>>> asyncio.run(main())
+([True, False], True, True)
+"""
+
+import asyncio
+import importlib
+import types
+import weakref
+
+from . import ecdh as _ecdh
+from .codecs import sec
+from .signatures import ecdsa
+
+
+def _sign(cls, prv, hashfunc, hashes):
+    return [ecdsa.sign(cls, prv, h, hashfunc=hashfunc) for h in hashes]
+
+
+def _verify(cls, items):
+    return [ecdsa.verify(*i) for i in items]
+
+
+def _derive(cls, prv, codec, peers):
+    return _ecdh.derive(cls, prv, peers, importlib.import_module(codec))
+
+
+def _decode(cls, codec, data):
+    codec = importlib.import_module(codec)
+    results = []
+    for d in data:
+        try:
+            results.append(codec.decode(cls, d))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class Dispatcher(object):
+    """Runs operations in an executor, coalescing them into batches
+
+    executor is any concurrent.futures executor (None uses the event loop
+    default). Requests of the same kind are collected for up to window
+    seconds or until batch of them are pending and are then run as one job.
+    At most limit jobs run at once; further jobs wait. At most queue
+    requests (limit * batch by default) are outstanding; further callers
+    wait in submit(). A dispatcher can be used from several event loops,
+    each with its own pending requests.
+
+    >>> calls = []
+    >>> def double(factor, items):
+    ...     calls.append(len(items))
+    ...     return [factor * i for i in items]
+    >>> dispatcher = Dispatcher(limit=1, batch=4, queue=4)
+    >>> async def main():
+    ...     jobs = [dispatcher.submit(double, (2,), i) for i in range(8)]
+    ...     return await asyncio.gather(*jobs)
+    >>> asyncio.run(main()) == asyncio.run(main()) == list(range(0, 16, 2))
+    True
+    >>> calls
+    [4, 4, 4, 4]
+    """
+
+    def __init__(self, executor=None, limit=1024, window=0.001, batch=64,
+                 queue=None):
+        self.executor = executor
+        self.window = window
+        self.batch = batch
+        self.__limit = limit
+        self.__queue = limit * batch if queue is None else queue
+        self.__loops = weakref.WeakKeyDictionary()
+
+    def __state(self, loop):
+        state = self.__loops.get(loop)
+        if state is None:
+            # Semaphores and futures are bound to the loop they are used in.
+            state = self.__loops[loop] = types.SimpleNamespace(
+                jobs=asyncio.Semaphore(self.__limit),
+                queue=asyncio.Semaphore(self.__queue),
+                pending={},
+                tasks=set(),
+            )
+        return state
+
+    async def submit(self, fn, key, item):
+        """Runs fn(*key, items) for a batch of items including this one
+
+        fn must return one result per item; exceptions in the results are
+        raised to the caller of the corresponding item.
+        """
+        loop = asyncio.get_running_loop()
+        state = self.__state(loop)
+
+        async with state.queue:
+            future = loop.create_future()
+
+            pending = state.pending.get((fn, key))
+            if pending is None:
+                pending = state.pending[(fn, key)] = []
+                loop.call_later(self.window, self.__flush, state, fn, key, pending)
+
+            pending.append((item, future))
+            if len(pending) >= self.batch:
+                self.__flush(state, fn, key, pending)
+
+            result = await future
+
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def __flush(self, state, fn, key, pending):
+        if state.pending.get((fn, key)) is not pending:
+            return
+
+        del state.pending[(fn, key)]
+
+        # The loop only keeps weak references to tasks.
+        task = asyncio.ensure_future(self.__run(state.jobs, fn, key, pending))
+        state.tasks.add(task)
+        task.add_done_callback(state.tasks.discard)
+
+    async def __run(self, semaphore, fn, key, pending):
+        loop = asyncio.get_running_loop()
+        items = [i for i, f in pending]
+
+        try:
+            async with semaphore:
+                results = await loop.run_in_executor(self.executor, fn, *(key + (items,)))
+        except Exception as e:
+            results = [e] * len(pending)
+
+        for (i, f), r in zip(pending, results):
+            if not f.done():
+                f.set_result(r)
+
+    async def sign(self, cls, prv, hsh, hashfunc=None):
+        "Awaitable ecdsa.sign()"
+        return await self.submit(_sign, (cls, prv, hashfunc), hsh)
+
+    async def verify(self, pub, hsh, r, s):
+        "Awaitable ecdsa.verify()"
+        return await self.submit(_verify, (pub.__class__,), (pub, hsh, r, s))
+
+    async def ecdh(self, cls, prv, peer, codec=sec):
+        "Awaitable ecdh.derive() for a single encoded peer"
+        return await self.submit(_derive, (cls, prv, codec.__name__), peer)
+
+    async def decode(self, cls, data, codec=sec):
+        "Awaitable codec.decode()"
+        return await self.submit(_decode, (cls, codec.__name__), data)
+
+
+_default = Dispatcher()
+
+
+def configure(*args, **kwargs):
+    "Replaces the dispatcher used by the module functions; see Dispatcher"
+    global _default
+    _default = Dispatcher(*args, **kwargs)
+
+
+async def sign(cls, prv, hsh, hashfunc=None):
+    "Awaitable ecdsa.sign()"
+    return await _default.sign(cls, prv, hsh, hashfunc)
+
+
+async def verify(pub, hsh, r, s):
+    "Awaitable ecdsa.verify()"
+    return await _default.verify(pub, hsh, r, s)
+
+
+async def ecdh(cls, prv, peer, codec=sec):
+    "Awaitable ecdh.derive() for a single encoded peer"
+    return await _default.ecdh(cls, prv, peer, codec)
+
+
+async def decode(cls, data, codec=sec):
+    "Awaitable codec.decode()"
+    return await _default.decode(cls, data, codec)
+
+
+async def multiply(point, multiplier, bits=32):
+    """Multiplies the point on the event loop, yielding every bits bits
+
+    Unlike the other functions this does not use an executor: the ladder
+    runs in the calling thread via Point.stepwise(), giving control back to
+    the event loop between the steps.
+
+    >>> from .curves.sec import secp521r1
+    >>> g = secp521r1.generator()
+    >>> asyncio.run(multiply(g, 12345, 4)) == g * 12345
+    True
+    """
+    steps = point.stepwise(multiplier, bits)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as e:
+            return e.value
+        await asyncio.sleep(0)
@@ -0,0 +1,105 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+An opt-in cache of decoded and validated points shared by the codecs.
+
+When enabled, the SEC1, CFRG and JWK decoders look up points by their curve
+and encoding before decompressing and validating them. Cached points are
+shared between callers and must be treated as immutable; decoded points are
+already in affine coordinates, so no library operation modifies them.
+
+>>> from .sec import encode, decode
+>>> from ..curves.sec import secp256r1
+>>> data = encode(secp256r1.generator() * 5)
+
+>>> enable(maxsize=16)
+>>> decode(secp256r1, data) is decode(secp256r1, data)
+True
+>>> stats()['hits'], stats()['misses'], stats()['entries']
+(1, 1, 1)
+>>> disable()
+>>> decode(secp256r1, data) is decode(secp256r1, data)
+False
+"""
+
+import sys
+
+from ..lru import LRU
+
+_cache = None
+
+
+def _sizeof(key, point):
+    return (sys.getsizeof(key[-1]) + sys.getsizeof(point.x)
+            + sys.getsizeof(point.y) + sys.getsizeof(point))
+
+
+def enable(maxsize=4096, maxbytes=None):
+    """Enables the cache, discarding any previous one
+
+    At most maxsize points are kept and, if maxbytes is given, at most
+    about maxbytes of memory is used by the points and their encodings.
+    """
+    global _cache
+    _cache = LRU(maxsize, maxbytes, _sizeof)
+
+
+def disable():
+    "Disables and discards the cache"
+    global _cache
+    _cache = None
+
+
+def stats():
+    "Returns the hits, misses, entries and bytes of the cache"
+    if _cache is None:
+        return {"hits": 0, "misses": 0, "entries": 0, "bytes": 0}
+
+    return {
+        "hits": _cache.hits,
+        "misses": _cache.misses,
+        "entries": len(_cache),
+        "bytes": _cache.bytes,
+    }
+
+
+def cached(codec, cls, data, decode):
+    """Returns decode() for the encoding, from the cache if it is enabled
+
+    The codec name and curve are part of the key, since the same bytes
+    mean different points in different codecs and curves.
+    """
+    cache = _cache
+    if cache is None:
+        return decode()
+
+    key = (codec, cls, bytes(data))
+    point = cache.get(key)
+    if point is None:
+        point = decode()
+        cache[key] = point
+    return point
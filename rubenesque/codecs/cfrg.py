@@ -29,11 +29,14 @@ Implements codec according to the protocol discussed on CFRG:
 http://www.ietf.org/mail-archive/web/cfrg/current/msg07256.html
 """
 
-from ..lcodec import lenc, ldec
+from ..lcodec import lenc, ldec, lenc_into
+from . import cache
+from . import lazy as _lazy
 
 
 def encode(point):
-    """
+    """Encodes the point; a LazyPoint is passed through without decoding
+
     >>> from ..curves.sec import secp224r1, secp521r1
     >>> from ..curves.cfrg import edwards25519, edwards448
 
@@ -50,13 +53,19 @@ def encode(point):
     b'\\xfe\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\x7f\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\x7f\\x00'
     """
 
-    l = point.bits() // 8 + 1
+    if type(point) is _lazy.LazyPoint:
+        data = point.encoding("cfrg")
+        if data is not None:
+            return data
+
+    l = point.context().cfrg_bytes
     b = (point.secondary & 1) << (l * 8 - 1)
     return lenc(point.primary | b, l, False)
 
 
-def decode(cls, bytes):
-    """
+def decode(cls, bytes, lazy=False):
+    """Decodes a point; if lazy is True, a lazy.LazyPoint is returned
+
     >>> from ..curves.sec import secp224r1, secp521r1
     >>> from ..curves.cfrg import edwards25519, edwards448
 
@@ -77,13 +86,77 @@ def decode(cls, bytes):
     True
     """
 
-    l = cls.bits() // 8 + 1
-    assert len(bytes) == l
+    l = cls.context().cfrg_bytes
+    if lazy:
+        assert len(bytes) == l
+        assert ldec(bytes, False) & ~(1 << (l * 8 - 1)) < cls.prime
+        return _lazy.LazyPoint(cls, "cfrg", bytes)
+
+    return cache.cached("cfrg", cls, bytes,
+                        lambda: _decode(cls, memoryview(bytes), l))
+
 
-    p = ldec(bytes, False)
+def _decode(cls, view, l):
+    assert len(view) == l
+
+    p = ldec(view, False)
     b = (p >> (l * 8 - 1)) & 1
     p &= ~(1 << (l * 8 - 1))
+    assert p < cls.prime
+
+    # Decompression only succeeds for points on the curve.
+    return cls.recover(p, b)
+
+
+def encode_many(points, buf=None, offset=0):
+    """Encodes the points as consecutive fixed-width records
+
+    All points are normalized with a single inversion. The records are
+    written to buf (i.e. a bytearray, memoryview or mmap) at the given
+    offset; if buf is None a new bytearray is allocated. Returns buf.
+
+    >>> from ..curves.cfrg import edwards25519
+    >>> g = edwards25519.generator()
+    >>> pts = [g, g * 2, g * 3]
+    >>> encode_many(pts) == b''.join(encode(p) for p in pts)
+    True
+    """
+    points = list(points)
+    if not points:
+        return bytearray() if buf is None else buf
+
+    cls = points[0].__class__
+    cls.normalize(points)
+
+    l = cls.context().cfrg_bytes
+    if buf is None:
+        buf = bytearray(offset + len(points) * l)
+
+    for point in points:
+        b = (point.secondary & 1) << (l * 8 - 1)
+        lenc_into(point.primary | b, l, buf, offset, False)
+        offset += l
+
+    return buf
+
+
+def decode_many(cls, data):
+    """Decodes a buffer of consecutive fixed-width records
+
+    The records are read through memoryview slices.
+
+    >>> from ..curves.cfrg import edwards25519
+    >>> g = edwards25519.generator()
+    >>> pts = [g, g * 2, g * 3]
+    >>> decode_many(edwards25519, encode_many(pts)) == pts
+    True
+    >>> decode_many(edwards25519, encode_many(pts)[1:])
+    Traceback (most recent call last):
+        ...
+    AssertionError
+    """
+    view = memoryview(data)
+    l = cls.context().cfrg_bytes
+    assert len(view) % l == 0
 
-    point = cls.recover(p, b)
-    assert point.is_valid
-    return point
+    return [_decode(cls, view[o:o + l], l) for o in range(0, len(view), l)]
@@ -26,7 +26,11 @@
 
 from ..lcodec import lenc, ldec
 from ..curves import find
+from . import cache
+from collections import namedtuple
+import hashlib
 import base64
+import json
 
 def b64u_enc(x):
     return base64.b64encode(x, b"-_").decode("UTF-8").rstrip("=")
@@ -61,8 +65,8 @@ def encode(point, prv=None):
         "secp521r1": "P-521",
     }
 
-    x = lenc(point.x, (point.bits() + 7) // 8)
-    y = lenc(point.y, (point.bits() + 7) // 8)
+    x = lenc(point.x, point.context().field_bytes)
+    y = lenc(point.y, point.context().field_bytes)
 
     jwk = {
         "kty": "EC",
@@ -72,7 +76,7 @@ def encode(point, prv=None):
     }
 
     if prv is not None:
-        d = lenc(prv, (point.bits() + 7) // 8)
+        d = lenc(prv, point.context().field_bytes)
         jwk["d"] = b64u_enc(d)
 
     return jwk
@@ -100,11 +104,119 @@ def decode(jwk):
     assert jwk["kty"] == "EC"
 
     crv = find(jwk["crv"])
-    x = ldec(b64u_dec(jwk["x"]))
-    y = ldec(b64u_dec(jwk["y"]))
     d = jwk.get("d", None)
 
     if d is not None:
         d = ldec(b64u_dec(d))
 
-    return (crv(x, y), d)
+    def _point():
+        pub = crv(ldec(b64u_dec(jwk["x"])), ldec(b64u_dec(jwk["y"])))
+        assert pub.is_valid
+        return pub
+
+    data = (jwk["x"] + "." + jwk["y"]).encode("UTF-8")
+    return (cache.cached("jwk", crv, data, _point), d)
+
+
+def thumbprint(jwk):
+    """Computes the RFC 7638 thumbprint of an EC JSON Web Key.
+
+    >>> jwk = { "kty": "EC", "crv": "P-256", "kid": "ignored"}
+    >>> jwk["x"] = "gI0GAILBdu7T53akrFmMyGcsF3n5dO7MmwNBHKW5SV0"
+    >>> jwk["y"] = "SLW_xSffzlPWrHEVI30DHM_4egVwt3NQqeUD7nMFpps"
+    >>> thumbprint(jwk)
+    '_GK0r6GCoJt9zcssg9lay4obIxgCq05ntiRymRHADSU'
+    """
+    members = {k: jwk[k] for k in ("crv", "kty", "x", "y")}
+    data = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    return b64u_enc(hashlib.sha256(data.encode("UTF-8")).digest())
+
+
+Key = namedtuple("Key", ("thumbprint", "public", "private"))
+
+
+class KeySet(object):
+    """A JWK Set indexed by key ID and RFC 7638 thumbprint.
+
+    Each key is decoded and validated once. When a new document is loaded,
+    keys which did not change are reused instead of being decoded again.
+    Keys which are not EC keys or which fail to decode are ignored.
+
+    >>> jwk = { "kty": "EC", "crv": "P-256", "kid": "a"}
+    >>> jwk["x"] = "gI0GAILBdu7T53akrFmMyGcsF3n5dO7MmwNBHKW5SV0"
+    >>> jwk["y"] = "SLW_xSffzlPWrHEVI30DHM_4egVwt3NQqeUD7nMFpps"
+    >>> bad = dict(jwk, kid="b", y=jwk["x"])
+    >>> keys = KeySet({"keys": [jwk, bad, {"kty": "oct", "k": ""}]})
+    >>> len(keys), keys.get("b")
+    (1, None)
+    >>> keys.get("a").public
+    secp256r1(808D060082C176EED3E776A4AC598CC8672C1779F974EECC9B03411CA5B9495D, 48B5BFC527DFCE53D6AC7115237D031CCFF87A0570B77350A9E503EE7305A69B)
+    >>> keys.find(thumbprint(jwk)) is keys.get("a")
+    True
+
+    Reloading reuses the unchanged key, even under a new key ID:
+    >>> keys.load(json.dumps({"keys": [dict(jwk, kid="c")]}))
+    0
+    >>> keys.get("c") is keys.find(thumbprint(jwk)), keys.get("a")
+    (True, None)
+    """
+
+    def __init__(self, document=None):
+        self.__keys = {}
+        self.__kids = {}
+        self.__thumbprints = {}
+
+        if document is not None:
+            self.load(document)
+
+    def load(self, document):
+        """Replaces the keys with those of a JWK Set (a dict or JSON text).
+
+        Returns the number of keys which had to be decoded.
+        """
+        if not isinstance(document, dict):
+            document = json.loads(document)
+
+        keys = {}
+        kids = {}
+        thumbprints = {}
+        decoded = 0
+
+        for jwk in document.get("keys", ()):
+            try:
+                ident = (jwk["kty"], jwk["crv"], jwk["x"], jwk["y"], jwk.get("d"))
+            except (KeyError, TypeError):
+                continue
+
+            key = keys.get(ident, self.__keys.get(ident))
+            if key is None:
+                try:
+                    pub, prv = decode(jwk)
+                except (AssertionError, NameError, ValueError, TypeError):
+                    continue
+                key = Key(thumbprint(jwk), pub, prv)
+                decoded += 1
+
+            keys[ident] = key
+            thumbprints[key.thumbprint] = key
+            if "kid" in jwk:
+                kids[jwk["kid"]] = key
+
+        self.__keys = keys
+        self.__kids = kids
+        self.__thumbprints = thumbprints
+        return decoded
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __iter__(self):
+        return iter(self.__keys.values())
+
+    def get(self, kid):
+        "Returns the Key with the key ID or None"
+        return self.__kids.get(kid)
+
+    def find(self, thumbprint):
+        "Returns the Key with the RFC 7638 thumbprint or None"
+        return self.__thumbprints.get(thumbprint)
@@ -0,0 +1,188 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Points which defer decoding until they are used.
+
+A LazyPoint keeps the encoding it was decoded from. Equality and hashing
+are answered from the canonical (compressed SEC1) bytes, which can be
+derived from any encoding without decompression, and encoding it again in
+its original format returns the original bytes. Decompression and
+validation only happen the first time a coordinate, a group operation or
+any other attribute of the point is needed.
+
+LazyPoint reports its curve as __class__, so isinstance() checks against
+the curve classes and the point arithmetic accept it like any other point.
+
+>>> from . import sec, cfrg
+>>> from ..curves.sec import secp256r1
+>>> g = secp256r1.generator()
+
+>>> a = sec.decode(secp256r1, sec.encode(g * 3), lazy=True)
+>>> b = sec.decode(secp256r1, sec.encode(g * 3, False), lazy=True)
+>>> c = cfrg.decode(secp256r1, cfrg.encode(g * 3), lazy=True)
+>>> a == b == c, hash(a) == hash(b) == hash(c), len({a, b, c})
+(True, True, 1)
+>>> isinstance(a, secp256r1), sec.encode(b, False) is b.data
+(True, True)
+>>> a.decoded, b.decoded, c.decoded
+(False, False, False)
+
+>>> a + g == g * 4, g + a == g * 4, a * 2 == g * 6, -a == -(g * 3)
+(True, True, True, True)
+>>> a.decoded
+True
+>>> sec.decode(secp256r1, b'\\x02' + b'\\x00' * 31 + b'\\x01', lazy=True).x
+Traceback (most recent call last):
+    ...
+AssertionError
+
+Coordinates out of the field's range are rejected up front, like eager
+decoding does:
+>>> cfrg.decode(secp256r1, b'\\xff' * 32 + b'\\x01', lazy=True)
+Traceback (most recent call last):
+    ...
+AssertionError
+"""
+
+import inspect
+from types import FunctionType
+
+from ..lcodec import lenc, ldec
+from . import sec, cfrg
+
+
+class LazyPoint(object):
+    "A point holding an encoding, decoded on first use"
+
+    def __init__(self, cls, codec, data):
+        self.curve = cls
+        self.codec = codec
+        self.data = data
+        self.__point = None
+        self.__canonical = None
+
+    @property
+    def __class__(self):
+        return self.curve
+
+    @property
+    def decoded(self):
+        "Whether the encoding has been decoded yet"
+        return self.__point is not None
+
+    @property
+    def point(self):
+        "The decoded and validated point"
+        if self.__point is None:
+            if self.codec == "cfrg":
+                self.__point = cfrg.decode(self.curve, self.data)
+            else:
+                self.__point = sec.decode(self.curve, self.data)
+        return self.__point
+
+    @property
+    def canonical(self):
+        "The compressed SEC1 encoding, derived without decompression"
+        if self.__canonical is None:
+            try:
+                self.__canonical = self.__canonicalize()
+            except (OverflowError, ValueError, IndexError):
+                # Invalid data: decoding raises AssertionError.
+                self.__canonical = sec.encode(self.point)
+
+        return self.__canonical
+
+    def __canonicalize(self):
+        l = self.curve.context().field_bytes
+
+        if self.codec == "cfrg":
+            v = ldec(self.data, False)
+            top = len(self.data) * 8 - 1
+            b = (v >> top) & 1
+            v &= ~(1 << top)
+            return lenc(b | 2, 1) + lenc(v, l)
+
+        if self.data[0] == 4:
+            return lenc(self.data[-1] & 1 | 2, 1) + bytes(self.data[1:l + 1])
+
+        return self.data
+
+    def encoding(self, codec, compressed=True):
+        "Returns the encoding if it is available without decoding, else None"
+        if codec == "cfrg":
+            return self.data if self.codec == "cfrg" else None
+
+        if self.codec == "sec" and (self.data[0] == 4) != compressed:
+            return self.data
+
+        return self.canonical if compressed else None
+
+    def __getattr__(self, name):
+        # Class level constants and class methods need no decoding.
+        try:
+            static = inspect.getattr_static(self.curve, name)
+        except AttributeError:
+            static = None
+
+        if static is not None and not isinstance(static, (property, FunctionType)):
+            return getattr(self.curve, name)
+
+        return getattr(self.point, name)
+
+    def __eq__(self, other):
+        if type(other) is LazyPoint and other.curve is self.curve:
+            return self.canonical == other.canonical
+        return self.point == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.curve, self.canonical))
+
+    def __add__(self, other):
+        return self.point + other
+
+    def __sub__(self, other):
+        return self.point - other
+
+    def __neg__(self):
+        return -self.point
+
+    def __mul__(self, other):
+        return self.point * other
+
+    def __truediv__(self, other):
+        return self.point / other
+    __floordiv__ = __truediv__
+    __div__ = __truediv__
+
+    def __reduce__(self):
+        return self.point.__reduce__()
+
+    def __repr__(self):
+        return repr(self.point)
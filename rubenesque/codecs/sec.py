@@ -24,11 +24,14 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from ..lcodec import lenc, ldec
+from ..lcodec import lenc, ldec, lenc_into
+from . import cache
+from . import lazy as _lazy
 
 
 def encode(point, compressed=True):
-    """
+    """Encodes the point; a LazyPoint is passed through without decoding
+
     >>> from ..curves.mdc import MDC201601
     >>> from ..curves.sec import secp224r1, secp521r1
     >>> from ..curves.cfrg import edwards25519, edwards448
@@ -63,9 +66,14 @@ def encode(point, compressed=True):
     >>> encode(edwards448.generator(), False)
     b'\\x04\\x7f\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\x7f\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xff\\xfey\\xa7\\x0b+p@\\x05S\\xae|\\x9d\\xf4\\x16\\xc7\\x92\\xc6\\x11(u\\x1a\\xc9)i$\\x0c%\\xa0}r\\x8b\\xdc\\x93\\xe2\\x1fw\\x87\\xedir$\\x9d\\xe72\\xf3\\x84\\x96\\xcd\\x11i\\x87\\x13\\t>\\x9c\\x04\\xfc'
     """
+    if type(point) is _lazy.LazyPoint:
+        data = point.encoding("sec", compressed)
+        if data is not None:
+            return data
+
     assert not point.is_identity
 
-    l = (point.bits() + 7) // 8
+    l = point.context().field_bytes
     p = lenc(point.primary, l)
 
     if compressed:
@@ -74,8 +82,9 @@ def encode(point, compressed=True):
         return b'\x04' + p + lenc(point.secondary, l)
 
 
-def decode(cls, bytes):
-    """
+def decode(cls, bytes, lazy=False):
+    """Decodes a point; if lazy is True, a lazy.LazyPoint is returned
+
     >>> from ..curves.mdc import MDC201601
     >>> from ..curves.sec import secp224r1, secp521r1
     >>> from ..curves.cfrg import edwards25519, edwards448
@@ -109,17 +118,120 @@ def decode(cls, bytes):
 
     >>> decode(edwards448, encode(edwards448.generator(), False))
     edwards448(79A70B2B70400553AE7C9DF416C792C61128751AC92969240C25A07D728BDC93E21F7787ED6972249DE732F38496CD11698713093E9C04FC, 7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFE)
+
+    >>> decode(secp224r1, b'')
+    Traceback (most recent call last):
+        ...
+    AssertionError
+    >>> decode(secp224r1, b'', lazy=True)
+    Traceback (most recent call last):
+        ...
+    AssertionError
     """
-    assert bytes.startswith((b'\x02', b'\x03', b'\x04'))
-
-    l = (cls.bits() + 7) // 8
-    z = bytes[0] if isinstance(bytes[0], int) else ord(bytes[0])
-    p = ldec(bytes[1:l + 1])
-    if z == 4:
-        s = ldec(bytes[l + 1:2 * l + 1])
-        point = cls.create(p, s)
-    else:
-        point = cls.recover(p, z & 1)
+    l = cls.context().field_bytes
+    if lazy:
+        assert len(bytes) >= 1 and bytes[0] in (2, 3, 4)
+        assert len(bytes) == 1 + l * (2 if bytes[0] == 4 else 1)
+        assert ldec(bytes[1:l + 1]) < cls.prime
+        assert bytes[0] != 4 or ldec(bytes[l + 1:]) < cls.prime
+        return _lazy.LazyPoint(cls, "sec", bytes)
+
+    return cache.cached("sec", cls, bytes,
+                        lambda: _decode(cls, memoryview(bytes), l))
+
+
+def _decode(cls, view, l):
+    assert len(view) >= 1
+    z = view[0]
+    assert z in (2, 3, 4)
+    assert len(view) == 1 + l * (2 if z == 4 else 1)
+
+    p = ldec(view[1:l + 1])
+    assert p < cls.prime
 
+    if z != 4:
+        # Decompression only succeeds for points on the curve.
+        return cls.recover(p, z & 1)
+
+    s = ldec(view[l + 1:])
+    assert s < cls.prime
+
+    point = cls.create(p, s)
     assert point.is_valid
     return point
+
+
+def encode_many(points, compressed=True, buf=None, offset=0):
+    """Encodes the points as consecutive fixed-width records
+
+    All points are normalized with a single inversion. The records are
+    written to buf (i.e. a bytearray, memoryview or mmap) at the given
+    offset; if buf is None a new bytearray is allocated. Returns buf.
+
+    >>> from ..curves.sec import secp256r1
+    >>> g = secp256r1.generator()
+    >>> pts = [g, g * 2, g * 3]
+    >>> encode_many(pts) == b''.join(encode(p) for p in pts)
+    True
+    >>> buf = bytearray(2 + 3 * 65)
+    >>> encode_many(pts, False, buf, 2) is buf
+    True
+    >>> bytes(buf[2:]) == b''.join(encode(p, False) for p in pts)
+    True
+    """
+    points = list(points)
+    if not points:
+        return bytearray() if buf is None else buf
+
+    cls = points[0].__class__
+    cls.normalize(points)
+
+    l = cls.context().field_bytes
+    w = 1 + l * (1 if compressed else 2)
+    if buf is None:
+        buf = bytearray(offset + len(points) * w)
+
+    for point in points:
+        assert not point.is_identity
+
+        if compressed:
+            buf[offset] = point.secondary & 1 | 2
+        else:
+            buf[offset] = 4
+            lenc_into(point.secondary, l, buf, offset + l + 1)
+
+        lenc_into(point.primary, l, buf, offset + 1)
+        offset += w
+
+    return buf
+
+
+def decode_many(cls, data):
+    """Decodes a buffer of consecutive fixed-width records
+
+    All records must use the same form as the first one (compressed or
+    uncompressed). The records are read through memoryview slices.
+
+    >>> from ..curves.sec import secp256r1
+    >>> g = secp256r1.generator()
+    >>> pts = [g, g * 2, g * 3]
+    >>> decode_many(secp256r1, encode_many(pts)) == pts
+    True
+    >>> decode_many(secp256r1, encode_many(pts, False)) == pts
+    True
+    >>> decode_many(secp256r1, b'')
+    []
+    >>> decode_many(secp256r1, encode_many(pts)[:-1])
+    Traceback (most recent call last):
+        ...
+    AssertionError
+    """
+    view = memoryview(data)
+    if len(view) == 0:
+        return []
+
+    l = cls.context().field_bytes
+    w = 1 + l * (2 if view[0] == 4 else 1)
+    assert len(view) % w == 0
+
+    return [_decode(cls, view[o:o + w], l) for o in range(0, len(view), w)]
@@ -0,0 +1,338 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Counts field and group operations, for profiling and operation budgets.
+
+While a counting() block is active, the library is instrumented: point
+coordinates become Element integers which count the multiplications,
+squarings and multiplications by small constants done with them, and
+inversions, square roots, point additions and point doublings are counted
+as they happen. Counts are attributed to the curve and the outermost
+library operation (e.g. ecdsa.verify or multiply) which caused them.
+When the block exits the instrumentation is removed, so there is no
+overhead when not counting. Counting is not thread-safe.
+
+>>> from .curves.sec import secp256r1
+>>> g = secp256r1.generator()
+>>> with counting() as report:
+...     p = g * 5
+>>> counts = report["secp256r1", "multiply"]
+>>> counts["calls"], counts["add"], counts["double"], counts["inv"]
+(1, 2, 3, 0)
+>>> counts["mul"] + counts["sqr"] > 0, type(p.x) is int
+(True, True)
+>>> hasattr(secp256r1.__add__, "__wrapped__")
+False
+
+>>> from hashlib import sha256
+>>> from .signatures import ecdsa
+>>> h = sha256(b'abc').digest()
+>>> r, s = ecdsa.sign(secp256r1, 5, h, hashfunc=sha256)
+>>> with counting() as report:
+...     ecdsa.verify(g * 5, h, r, s)
+True
+>>> counts = report.total(operation="ecdsa.verify")
+>>> counts["inv"], counts["sqrt"], counts["mul"] + counts["sqr"] < 20000
+(3, 0, True)
+>>> report.total()["calls"]
+2
+
+Points returned by generators or held by other objects are not left with
+Element coordinates either:
+>>> from .signatures import eddsa
+>>> from .curves.cfrg import edwards25519
+>>> with counting() as report:
+...     pairs = list(secp256r1.generate_keypairs(2))
+...     key = eddsa.SigningKey(edwards25519)
+>>> type(pairs[0][1].x) is int, type(key.public.x) is int
+(True, True)
+"""
+
+import functools
+import importlib
+import sys
+import weakref
+from collections import Counter
+
+from . import math as _math
+from . import patches
+
+# Operations counted as top-level: (module, class, attribute, name)
+OPERATIONS = (
+    ("rubenesque.curves.base", "Point", "__mul__", "multiply"),
+    ("rubenesque.curves.base", "Point", "base_multiply", "base_multiply"),
+    ("rubenesque.curves.base", "Point", "combine", "combine"),
+    ("rubenesque.curves.base", "Point", "generate_keypairs", "generate_keypairs"),
+    ("rubenesque.codecs.sec", None, "decode", "sec.decode"),
+    ("rubenesque.codecs.cfrg", None, "decode", "cfrg.decode"),
+    ("rubenesque.codecs.jwk", None, "decode", "jwk.decode"),
+    ("rubenesque.signatures.ecdsa", None, "sign", "ecdsa.sign"),
+    ("rubenesque.signatures.ecdsa", None, "verify", "ecdsa.verify"),
+    ("rubenesque.signatures.eddsa", None, "sign", "eddsa.sign"),
+    ("rubenesque.signatures.eddsa", None, "verify", "eddsa.verify"),
+    ("rubenesque.signatures.eddsa", None, "verify_batch", "eddsa.verify_batch"),
+    ("rubenesque.ecdh", None, "derive", "ecdh.derive"),
+)
+
+# The coordinate systems whose points are instrumented
+POINTS = ("rubenesque.curves.weierstrass", "rubenesque.curves.edwards")
+
+_report = None
+_counts = None
+_inside = False
+_points = []
+
+
+class Element(int):
+    """An integer which counts the multiplications done with it
+
+    Outside of counting() blocks the results are plain integers, so an
+    Element which escaped the instrumentation does not spread.
+    """
+
+    __slots__ = ()
+
+    def __mul__(self, other):
+        counts = _counts
+        if counts is None:
+            return int.__mul__(self, other)
+        if type(other) is Element:
+            counts["sqr" if other is self else "mul"] += 1
+        elif other.bit_length() > 32:
+            counts["mul"] += 1
+        else:
+            counts["mul_small"] += 1
+        return Element(int.__mul__(self, other))
+    __rmul__ = __mul__
+
+    def __pow__(self, exponent, modulus=None):
+        counts = _counts
+        if counts is None:
+            return int.__pow__(self, exponent, modulus)
+        counts["sqr" if exponent == 2 else "exp"] += 1
+        return Element(int.__pow__(self, exponent, modulus))
+
+    def __add__(self, other):
+        r = int.__add__(self, other)
+        return r if _counts is None else Element(r)
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        r = int.__sub__(self, other)
+        return r if _counts is None else Element(r)
+
+    def __rsub__(self, other):
+        r = int.__rsub__(self, other)
+        return r if _counts is None else Element(r)
+
+    def __mod__(self, other):
+        r = int.__mod__(self, other)
+        return r if _counts is None else Element(r)
+
+    def __neg__(self):
+        r = int.__neg__(self)
+        return r if _counts is None else Element(r)
+
+
+class Report(dict):
+    "Maps (curve name, operation) to a Counter of the operations counted"
+
+    def counter(self, curve, operation):
+        key = (curve, operation)
+        counts = self.get(key)
+        if counts is None:
+            counts = self[key] = Counter()
+        return counts
+
+    def total(self, curve=None, operation=None):
+        "Sums the counts, optionally only of one curve or operation"
+        total = Counter()
+        for (c, o), counts in self.items():
+            if curve in (None, c) and operation in (None, o):
+                total.update(counts)
+        return total
+
+
+def _curve(args):
+    if not args:
+        return None
+
+    arg = getattr(args[0], "curve", args[0])
+    cls = arg if isinstance(arg, type) else type(arg)
+    return cls.__name__ if hasattr(cls, "generator") else None
+
+
+def _strip(point):
+    "Replaces the Elements of the point by plain integers"
+    attrs = point.__dict__
+    for name, value in attrs.items():
+        if type(value) is Element:
+            attrs[name] = int(value)
+
+
+def _operation(func, name):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _counts, _inside
+        if _inside:
+            return func(*args, **kwargs)
+
+        _counts = _report.counter(_curve(args), name)
+        _counts["calls"] += 1
+        _inside = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _inside = False
+            _counts = _report.counter(None, None)
+    return wrapper
+
+
+def _add(func):
+    @functools.wraps(func)
+    def wrapper(self, other):
+        global _counts
+        counts = _counts
+        if not (self.is_identity or other.is_identity):
+            _counts = None
+            double = self is other or self == other
+            _counts = counts
+            counts["double" if double else "add"] += 1
+        return func(self, other)
+    return _operation(wrapper, "add")
+
+
+def _double(func):
+    @functools.wraps(func)
+    def wrapper(self):
+        if not self.is_identity:
+            _counts["double"] += 1
+        return func(self)
+    return _operation(wrapper, "double")
+
+
+def _init(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        func(self, *args, **kwargs)
+        _points.append(weakref.ref(self))
+        attrs = self.__dict__
+        for name, value in attrs.items():
+            if type(value) is int:
+                attrs[name] = Element(value)
+    return wrapper
+
+
+# Inversions and square roots return plain integers: points created before
+# the block may be normalized within it, and must not keep Elements.
+
+def _inv(n, m):
+    _counts["inv"] += 1
+    return _math.inv(int(n), int(m))
+
+
+def _inv_many(values, m):
+    values = [int(v) for v in values]
+    if values:
+        _counts["inv"] += 1
+        _counts["mul"] += 3 * (len(values) - 1)
+    return _math.inv_many(values, int(m))
+
+
+def _sqrt(n, p, plan=None):
+    _counts["sqrt"] += 1
+    return _math.sqrt(int(n), int(p), plan)
+
+
+def _wrap(name):
+    def wrap(value):
+        if isinstance(value, classmethod):
+            return classmethod(_operation(value.__func__, name))
+        return _operation(value, name)
+    return wrap
+
+
+def _install():
+    for module, cls, attr, name in OPERATIONS:
+        owner = importlib.import_module(module)
+        if cls is not None:
+            owner = getattr(owner, cls)
+        patches.patch(__name__, owner, attr, _wrap(name))
+
+    for module in POINTS:
+        cls = importlib.import_module(module).Point
+        patches.patch(__name__, cls, "__add__", _add)
+        patches.patch(__name__, cls, "double", _double)
+        patches.patch(__name__, cls, "__init__", _init)
+
+    replacements = {_math.inv: _inv, _math.inv_many: _inv_many, _math.sqrt: _sqrt}
+    for name, module in list(sys.modules.items()):
+        if name.startswith("rubenesque.") and module is not _math \
+                and module is not sys.modules[__name__]:
+            for attr, value in list(vars(module).items()):
+                if callable(value) and value in replacements:
+                    replacement = replacements[value]
+                    patches.patch(__name__, module, attr,
+                                  lambda value, r=replacement: r)
+
+
+def _uninstall():
+    patches.unpatch(__name__)
+
+    # Only points created within the block hold Elements, wherever they are
+    # kept (results, generators, tables or other objects).
+    while _points:
+        point = _points.pop()()
+        if point is not None:
+            _strip(point)
+
+
+class counting(object):
+    """Counts operations within the block; entering returns the Report
+
+    Blocks cannot be nested.
+    """
+
+    def __enter__(self):
+        global _report, _counts
+        assert _report is None
+        _report = Report()
+        _counts = _report.counter(None, None)
+        _install()
+        return _report
+
+    def __exit__(self, *args):
+        global _report, _counts
+        report = _report
+        try:
+            _uninstall()
+        finally:
+            _report = None
+            _counts = None
+
+        if not report.get((None, None)):
+            report.pop((None, None), None)
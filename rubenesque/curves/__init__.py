@@ -24,16 +24,56 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+"""
+The curve modules are imported when one of their curves is first requested.
+
+>>> import subprocess, sys
+>>> code = "import sys, rubenesque.curves as c; c.find('P-256'); " \\
+...        "print(sorted(m for m in sys.modules if m.startswith('rubenesque.curves.')))"
+>>> print(subprocess.check_output([sys.executable, "-c", code]).decode().strip())
+['rubenesque.curves.base', 'rubenesque.curves.codegen', 'rubenesque.curves.prime', 'rubenesque.curves.sec', 'rubenesque.curves.weierstrass']
+"""
+
+import importlib
+
 from . import base
-from . import brainpool
-from . import cfrg
-from . import sec
-from . import mdc
+
+# The module, name, aliases and COSE identifier of each shipped curve. This
+# must match the curve classes; find() uses it to import the right module.
+CURVES = (
+    ("brainpool", "brainpoolP160r1", "1.3.36.3.3.2.8.1.1.1"),
+    ("brainpool", "brainpoolP192r1", "1.3.36.3.3.2.8.1.1.3"),
+    ("brainpool", "brainpoolP224r1", "1.3.36.3.3.2.8.1.1.5"),
+    ("brainpool", "brainpoolP256r1", "1.3.36.3.3.2.8.1.1.7"),
+    ("brainpool", "brainpoolP320r1", "1.3.36.3.3.2.8.1.1.9"),
+    ("brainpool", "brainpoolP384r1", "1.3.36.3.3.2.8.1.1.11"),
+    ("brainpool", "brainpoolP512r1", "1.3.36.3.3.2.8.1.1.13"),
+    ("cfrg", "edwards25519", "ed25519", "Ed25519", 6),
+    ("cfrg", "edwards448", "ed448"),
+    ("cfrg", "ed448goldilocks", "Ed448-Goldilocks", "Ed448", 7),
+    ("sec", "secp192r1", "1.2.840.10045.3.1.1"),
+    ("sec", "secp224r1", "1.3.132.0.33"),
+    ("sec", "secp256r1", "1.2.840.10045.3.1.7", "P256", "P-256", 1),
+    ("sec", "secp384r1", "1.3.132.0.34", "P384", "P-384", 2),
+    ("sec", "secp521r1", "1.3.132.0.35", "P521", "P-521", 3),
+    ("mdc", "MDC201601"),
+)
+
+_modules = {id: row[0] for row in CURVES for id in row[1:]}
+
+
+def __getattr__(name):
+    "Imports the curve modules on first attribute access"
+    if name in {row[0] for row in CURVES}:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def find(id):
     """Returns a point class for the given curve identifier
 
+    Curves are indexed when they are defined, so lookups take constant time.
+
     Identifiers can be the class name:
     >>> find('secp256r1')
     <class 'rubenesque.curves.sec.secp256r1'>
@@ -50,44 +90,54 @@ def find(id):
     >>> find("1.2.840.10045.3.1.1")
     <class 'rubenesque.curves.sec.secp192r1'>
 
+    Identifiers can be JOSE names or COSE curve identifiers:
+    >>> find("Ed448")
+    <class 'rubenesque.curves.cfrg.ed448goldilocks'>
+    >>> find(6)
+    <class 'rubenesque.curves.cfrg.edwards25519'>
+
     >>> find('snoopyCurve')
     Traceback (most recent call last):
         ...
     NameError: Unknown curve 'snoopyCurve'
+    >>> find(['P-256'])
+    Traceback (most recent call last):
+        ...
+    NameError: Unknown curve '['P-256']'
     """
 
-    def _inner(name, cls=base.Point):
-        if cls.__name__ == name:
-            return cls
-
-        if name in cls.aliases:
-            return cls
+    try:
+        cls = base._registry.get(id)
+    except TypeError:
+        # Unhashable identifiers, e.g. from untrusted JWK or COSE input
+        raise NameError("Unknown curve '%s'" % (id,)) from None
 
-        for c in cls.__subclasses__():
-            cc = _inner(name, c)
-            if cc is not None:
-                return cc
+    if cls is None and id in _modules:
+        importlib.import_module("." + _modules[id], __name__)
+        cls = base._registry.get(id)
 
-        return None
-
-    cls =  _inner(id)
     if cls is None:
         raise NameError("Unknown curve '%s'" % id)
     return cls
 
+
 def supported():
     """Returns a list of the names of supported curves.
 
     >>> tuple(sorted(supported()))
-    ('MDC201601', 'brainpoolP160r1', 'brainpoolP192r1', 'brainpoolP224r1', 'brainpoolP256r1', 'brainpoolP320r1', 'brainpoolP384r1', 'brainpoolP512r1', 'edwards25519', 'edwards448', 'secp192r1', 'secp224r1', 'secp256r1', 'secp384r1', 'secp521r1')
+    ('MDC201601', 'brainpoolP160r1', 'brainpoolP192r1', 'brainpoolP224r1', 'brainpoolP256r1', 'brainpoolP320r1', 'brainpoolP384r1', 'brainpoolP512r1', 'ed448goldilocks', 'edwards25519', 'edwards448', 'secp192r1', 'secp224r1', 'secp256r1', 'secp384r1', 'secp521r1')
+
+    The static table matches the curves the modules define:
+    >>> for module in set(row[0] for row in CURVES):
+    ...     _ = importlib.import_module("." + module, __name__)
+    >>> _modules == {id: cls.__module__.split('.')[-1]
+    ...              for id, cls in base._registry.items()
+    ...              if cls.__module__.startswith(__name__ + '.')}
+    True
     """
 
-    def _inner(cls=base.Point):
-        if not cls.__subclasses__():
-            yield cls.__name__
-        else:
-            for c in cls.__subclasses__():
-                for n in _inner(c):
-                    yield n
-
-    return _inner()
+    names = [row[1] for row in CURVES]
+    for cls in dict.fromkeys(base._registry.values()):
+        if cls.__name__ not in names:
+            names.append(cls.__name__)
+    return names
@@ -27,21 +27,61 @@
 
 import abc
 import os
+import types
 
 from ..math import inv
 from ..lcodec import ldec
+from .. import tuning
 
+# The defaults of the tunable parameters, see rubenesque.tuning
 
-if not hasattr(abc, "ABC"):
-    abc.ABC = abc.ABCMeta(str('ABC'), (), {})
+# Window width of interleaved (Straus) multi-scalar multiplication
+STRAUS_WINDOW = 4
+
+# Number of terms above which multi-scalar multiplication uses buckets
+PIPPENGER_THRESHOLD = 128
+
+# Window width of the precomputed generator tables
+FIXED_WINDOW = 4
+
+_tables = {}
+
+_contexts = {}
+
+# Curve classes indexed by name, alias (OIDs, JOSE names) and COSE identifier
+_registry = {}
+
+
+def _restore(name, data):
+    "Recreates a point pickled by Point.__reduce__()"
+    from . import find
+    from ..codecs import sec
+
+    cls = find(name)
+    return cls() if not data else sec.decode(cls, data)
 
 
 class Point(abc.ABC):
     generator = None
     cofactor = 1
     aliases = ()
+    cose = None
     order = 0
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # The coordinate system classes do not define a curve.
+        if not cls.order:
+            return
+
+        ids = (cls.__name__,) + cls.__dict__.get("aliases", ())
+        if cls.__dict__.get("cose") is not None:
+            ids += (cls.cose,)
+
+        for id in ids:
+            _registry.setdefault(id, cls)
+
     @classmethod
     @abc.abstractmethod
     def bits(cls):
@@ -62,18 +102,229 @@ class Point(abc.ABC):
     def recover(cls, primary, bit):
         "Recovers a point using the primary coordinate and a secondary bit"
 
+    @classmethod
+    def constants(cls):
+        "Computes the constants derived from the curve parameters"
+        constants = {
+            "order_bits": cls.order.bit_length(),
+            "scalar_bytes": (cls.order.bit_length() + 7) // 8,
+            "scalar_mask": 2 ** cls.order.bit_length() - 1,
+            "multiply": "ladder",
+            "window": 4,
+            "straus_window": STRAUS_WINDOW,
+            "pippenger_threshold": PIPPENGER_THRESHOLD,
+            "fixed_window": FIXED_WINDOW,
+        }
+        constants.update(tuning.settings(cls.__name__))
+        return constants
+
+    @classmethod
+    def context(cls):
+        """Returns the constants derived from the curve parameters
+
+        They are computed once per curve by constants() and shared by the
+        codecs, the signatures and the point arithmetic.
+
+        >>> from .sec import secp256r1
+        >>> ctx = secp256r1.context()
+        >>> ctx.bits, ctx.field_bytes, ctx.cfrg_bytes, ctx.scalar_bytes
+        (256, 32, 33, 32)
+        >>> ctx.a_zero, ctx.a_minus3, secp256r1.context() is ctx
+        (False, True, True)
+        """
+        try:
+            return _contexts[cls]
+        except KeyError:
+            ctx = types.SimpleNamespace(**cls.constants())
+            return _contexts.setdefault(cls, ctx)
+
     @classmethod
     def private_key(cls, min=1):
         "Generates a random integer suitable for use as a private key"
-        bytes = (cls.order.bit_length() + 7) // 8
-        mask = 2 ** cls.order.bit_length() - 1
+        ctx = cls.context()
 
         r = 0
         while r < min or r >= cls.order:
-            r = ldec(os.urandom(bytes)) & mask
+            r = ldec(os.urandom(ctx.scalar_bytes)) & ctx.scalar_mask
 
         return r
 
+    @classmethod
+    def generate_keypairs(cls, n, encode=None, batch=256):
+        """Yields n (private key, public key) pairs
+
+        Randomness is read from os.urandom() a batch at a time and rejection
+        sampled from the buffer. Public keys are computed by base_multiply()
+        and converted to affine coordinates a batch at a time. If encode is
+        given (e.g. codecs.sec.encode), public keys are yielded encoded.
+
+        >>> from .sec import secp256r1
+        >>> from ..codecs import sec
+        >>> pairs = list(secp256r1.generate_keypairs(3))
+        >>> len(pairs), all(secp256r1.generator() * k == p for k, p in pairs)
+        (3, True)
+        >>> k, p = next(secp256r1.generate_keypairs(1, sec.encode))
+        >>> p == sec.encode(secp256r1.generator() * k)
+        True
+        """
+        ctx = cls.context()
+        size = ctx.scalar_bytes
+
+        while n > 0:
+            count = min(n, batch)
+            keys = []
+            while len(keys) < count:
+                buf = os.urandom(size * (count - len(keys)) * 2)
+                for i in range(0, len(buf), size):
+                    k = ldec(buf[i:i + size]) & ctx.scalar_mask
+                    if 0 < k < cls.order and len(keys) < count:
+                        keys.append(k)
+
+            pubs = [cls.base_multiply(k) for k in keys]
+            cls.normalize(pubs)
+            if encode is not None:
+                pubs = [encode(p) for p in pubs]
+
+            for pair in zip(keys, pubs):
+                yield pair
+            n -= count
+
+    @classmethod
+    def precompute(cls):
+        """Returns the table of generator multiples used by base_multiply()
+
+        The table is built on first use and shared by all later calls. Row i
+        holds the multiples j * 2 ** (i * w) of the generator for
+        0 < j < 2 ** w, in affine coordinates, where w is the fixed_window
+        of the curve's context.
+        """
+        table = _tables.get(cls)
+        if table is not None:
+            return table
+
+        w = cls.context().fixed_window
+        rows = []
+        base = cls.generator()
+        for i in range((cls.context().order_bits + w - 1) // w):
+            row = [base]
+            for j in range(2, 1 << w):
+                row.append(row[-1] + base)
+            base = row[-1] + base
+            rows.append(row)
+
+        cls.normalize([p for row in rows for p in row])
+        table = _tables.setdefault(cls, rows)
+        return table
+
+    @classmethod
+    def base_multiply(cls, k):
+        """Multiplies the generator using the precomputed table
+
+        This only needs additions, no doublings.
+
+        >>> from .sec import secp256r1
+        >>> k = secp256r1.order - 5
+        >>> secp256r1.base_multiply(k) == secp256r1.generator() * k
+        True
+        >>> secp256r1.base_multiply(0).is_identity
+        True
+        """
+        rows = cls.precompute()
+        w = cls.context().fixed_window
+        mask = (1 << w) - 1
+        k %= cls.order
+
+        q = cls()
+        for row in rows:
+            if k == 0:
+                break
+            d = k & mask
+            if d != 0:
+                q += row[d - 1]
+            k >>= w
+
+        return q
+
+    @classmethod
+    def combine(cls, points, scalars):
+        """Computes the sum of the points each multiplied by its scalar
+
+        Few terms are evaluated with interleaved windows (Straus), so a
+        double-scalar multiplication shares all of its doublings. Many
+        terms are evaluated with buckets (Pippenger).
+
+        >>> from .sec import secp256r1
+        >>> g = secp256r1.generator()
+        >>> secp256r1.combine([g, g * 3], [5, 7]) == g * 26
+        True
+        >>> secp256r1.combine([g, g * 3], [0, 0]).is_identity
+        True
+        >>> pts = [g * i for i in range(1, PIPPENGER_THRESHOLD + 2)]
+        >>> secp256r1.combine(pts, range(len(pts))) == g * sum(i * (i + 1) for i in range(len(pts)))
+        True
+        """
+        terms = [(p, k) for p, k in zip(points, scalars)
+                 if k != 0 and not p.is_identity]
+
+        ctx = cls.context()
+        if len(terms) > ctx.pippenger_threshold:
+            return cls.__pippenger(terms)
+
+        return cls.__straus(terms, ctx.straus_window)
+
+    @classmethod
+    def __straus(cls, terms, w):
+        mask = (1 << w) - 1
+
+        tables = []
+        for p, k in terms:
+            t = [cls(), p]
+            for i in range(2, mask + 1):
+                t.append(t[-1] + p)
+            tables.append((t, k))
+
+        bits = max([k.bit_length() for p, k in terms] + [1])
+        q = cls()
+        for shift in range((bits - 1) // w * w, -1, -w):
+            for i in range(w):
+                q = q.double()
+            for t, k in tables:
+                d = (k >> shift) & mask
+                if d != 0:
+                    q += t[d]
+
+        return q
+
+    @classmethod
+    def __pippenger(cls, terms):
+        w = max(2, len(terms).bit_length() - 3)
+        mask = (1 << w) - 1
+
+        bits = max(k.bit_length() for p, k in terms)
+        q = cls()
+        for shift in range((bits - 1) // w * w, -1, -w):
+            for i in range(w):
+                q = q.double()
+
+            buckets = [cls() for i in range(mask + 1)]
+            for p, k in terms:
+                d = (k >> shift) & mask
+                if d != 0:
+                    buckets[d] += p
+
+            run = cls()
+            for d in range(mask, 0, -1):
+                run += buckets[d]
+                q += run
+
+        return q
+
+    @classmethod
+    def normalize(cls, points):
+        "Converts many points to affine coordinates"
+        for p in points:
+            p.x
+
     @abc.abstractmethod
     def __init__(self, x=None, y=None, *args, **kwargs):
         "Creates a new point with the specified coordinates"
@@ -116,19 +367,118 @@ class Point(abc.ABC):
     def __neg__(self):
         "Invert a point"
 
+    def double(self):
+        "Adds the point to itself"
+        return self + self
+
     def __mul__(self, multiplier):
+        """Multiplies the point using the strategy set in the curve's context
+
+        The default is a Montgomery ladder; "window" uses fixed windows and
+        "wnaf" a width-w non-adjacent form, both of width ctx.window.
+
+        >>> from .sec import secp256r1
+        >>> g = secp256r1.generator()
+        >>> k = secp256r1.order - 12345
+        >>> ctx = secp256r1.context()
+        >>> results, default = [], ctx.multiply
+        >>> try:
+        ...     for strategy in ("ladder", "window", "wnaf"):
+        ...         ctx.multiply = strategy
+        ...         results.append(g * k)
+        ... finally:
+        ...     ctx.multiply = default
+        >>> results[0] == results[1] == results[2] == secp256r1.base_multiply(k)
+        True
+        """
         if multiplier == 0:
             return self.__class__()
 
+        ctx = self.__class__.context()
+        if ctx.multiply == "window":
+            return self.__class__.__straus([(self, multiplier)], ctx.window)
+        if ctx.multiply == "wnaf":
+            return self.__wnaf(multiplier, ctx.window)
+
+        q = self.__class__()
+        p = self
+        for o in range(multiplier.bit_length(), -1, -1):
+            if multiplier & (1 << o):
+                q += p
+                p = p.double()
+            else:
+                p += q
+                q = q.double()
+
+        return q
+
+    def __wnaf(self, k, w):
+        digits = []
+        while k:
+            d = 0
+            if k & 1:
+                d = k & ((1 << w) - 1)
+                if d >= 1 << (w - 1):
+                    d -= 1 << w
+                k -= d
+            digits.append(d)
+            k >>= 1
+
+        double = self.double()
+        odd = [self]
+        for i in range(1, 1 << (w - 2)):
+            odd.append(odd[-1] + double)
+        neg = [-p for p in odd]
+
+        q = self.__class__()
+        for d in reversed(digits):
+            q = q.double()
+            if d > 0:
+                q += odd[d >> 1]
+            elif d < 0:
+                q += neg[-d >> 1]
+
+        return q
+
+    def stepwise(self, multiplier, bits=32):
+        """Multiplies the point, pausing after every bits bits
+
+        This is a generator running the Montgomery ladder; it yields None
+        whenever bits bits of the multiplier have been processed and returns
+        the product (as the value of StopIteration). Callers can interleave
+        other work between the steps.
+
+        It always uses the ladder, whatever the multiply strategy of the
+        curve's context is: its cost only matches __mul__() for curves
+        which are not tuned to "window" or "wnaf".
+
+        >>> from .sec import secp521r1
+        >>> g = secp521r1.generator()
+        >>> def run(gen):
+        ...     n = 0
+        ...     while True:
+        ...         try:
+        ...             next(gen)
+        ...         except StopIteration as e:
+        ...             return n, e.value
+        ...         n += 1
+        >>> run(g.stepwise(2 ** 200 + 1, 64)) == (3, g * (2 ** 200 + 1))
+        True
+        >>> run(g.stepwise(0))[1].is_identity
+        True
+        """
         q = self.__class__()
         p = self
         for o in range(multiplier.bit_length(), -1, -1):
             if multiplier & (1 << o):
                 q += p
-                p += p
+                p = p.double()
             else:
                 p += q
-                q += q
+                q = q.double()
+
+            if o > 0 and o % bits == 0:
+                yield
 
         return q
 
@@ -140,10 +490,28 @@ class Point(abc.ABC):
     def __sub__(self, other):
         return self + -other
 
+    def __reduce__(self):
+        """Pickles the point as its curve name and compressed SEC1 encoding
+
+        >>> import pickle
+        >>> from .sec import secp256r1
+        >>> g = secp256r1.generator() * 5
+        >>> len(pickle.dumps(g)) < 128
+        True
+        >>> pickle.loads(pickle.dumps(g)) == g
+        True
+        >>> pickle.loads(pickle.dumps(secp256r1())).is_identity
+        True
+        """
+        from ..codecs import sec
+
+        data = b'' if self.is_identity else sec.encode(self)
+        return (_restore, (self.__class__.__name__, data))
+
     def __repr__(self):
         if self.is_identity:
             return "%s(∞)" % self.__class__.__name__
 
-        l = (self.__class__.bits() + 7) // 8 * 2
+        l = self.__class__.context().field_bytes * 2
         t = "%s(%%0%dX, %%0%dX)" % (self.__class__.__name__, l, l)
         return t % (self.x, self.y)
@@ -72,7 +72,8 @@ class edwards25519(Point):
     d = 0x52036cee2b6ffe738cc740797779e89800700a4d4141d8ab75eb4dca135978a3
     order = 0x1000000000000000000000000000000014def9dea2f79cd65812631a5cf5d3ed
     prime = 0x7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffed
-    aliases = ("ed25519", )
+    aliases = ("ed25519", "Ed25519")
+    cose = 6
     cofactor = 8
 
     @classmethod
@@ -137,3 +138,58 @@ class edwards448(Point):
             0x79a70b2b70400553ae7c9df416c792c61128751ac92969240c25a07d728bdc93e21f7787ed6972249de732f38496cd11698713093e9c04fc,
             0x7fffffffffffffffffffffffffffffffffffffffffffffffffffffff7ffffffffffffffffffffffffffffffffffffffffffffffffffffffe
         )
+
+
+class ed448goldilocks(Point):
+    """
+    The untwisted Edwards curve used by Ed448 (RFC 8032, section 5.2).
+
+    Unlike edwards448 above, which is birationally equivalent to curve448,
+    this curve is 4-isogenous to curve448 (d = -39081).
+
+    >>> from . import find
+    >>> cls = find("ed448goldilocks")
+    >>> find("Ed448-Goldilocks")
+    <class 'rubenesque.curves.cfrg.ed448goldilocks'>
+
+    Test basic math:
+    >>> cls().is_identity
+    True
+    >>> (-cls()).is_identity
+    True
+    >>> cls().is_valid
+    False
+    >>> (cls.generator() * 0).is_identity
+    True
+    >>> cls.generator() * 1 == cls.generator()
+    True
+    >>> cls.generator() + cls.generator() * 0 == cls.generator()
+    True
+    >>> cls.generator() + cls.generator() == cls.generator() * 2
+    True
+    >>> cls.generator() * 2 + cls.generator() == cls.generator() * 3
+    True
+    >>> cls.generator() * 2 - cls.generator() == cls.generator()
+    True
+    >>> cls.generator() * 6 / 3 == cls.generator() * 2
+    True
+    >>> (cls.generator() * cls.order).is_identity
+    True
+
+    >>> ed448goldilocks.generator()
+    ed448goldilocks(4F1970C66BED0DED221D15A622BF36DA9E146570470F1767EA6DE324A3D3A46412AE1AF72AB66511433B80E18B00938E2626A82BC70CC05E, 693F46716EB6BC248876203756C9C7624BEA73736CA3984087789C1E05A0C2D73AD3FF1CE67C39C4FDBD132C4ED7C8AD9808795BF230FA14)
+    """
+
+    d = 0xfffffffffffffffffffffffffffffffffffffffffffffffffffffffeffffffffffffffffffffffffffffffffffffffffffffffffffff6756
+    order = 0x3fffffffffffffffffffffffffffffffffffffffffffffffffffffff7cca23e9c44edb49aed63690216cc2728dc58f552378c292ab5844f3
+    prime = 0xfffffffffffffffffffffffffffffffffffffffffffffffffffffffeffffffffffffffffffffffffffffffffffffffffffffffffffffffff
+    aliases = ("Ed448-Goldilocks", "Ed448")
+    cose = 7
+    cofactor = 4
+
+    @classmethod
+    def generator(cls):
+        return cls(
+            0x4f1970c66bed0ded221d15a622bf36da9e146570470f1767ea6de324a3d3a46412ae1af72ab66511433b80e18b00938e2626a82bc70cc05e,
+            0x693f46716eb6bc248876203756c9c7624bea73736ca3984087789c1e05a0c2d73ad3ff1ce67c39c4fdbd132c4ed7c8ad9808795bf230fa14
+        )
@@ -0,0 +1,175 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Generates the point addition and doubling functions specialized per curve.
+
+The curve's prime and coefficients are inlined as constants, terms which
+vanish for its coefficients (a = 0, a = -3, a = 1, a = -1) are folded
+away and intermediate values are only reduced where a product needs it.
+The functions take and return coordinate tuples and use only locals, so
+the interpreter does no attribute lookups.
+
+The generated source is cached per curve, can be read with source(), and
+is registered with linecache so tracebacks and inspect.getsource() show it.
+The coordinate systems build the functions when each curve class is created.
+
+>>> from .sec import secp256r1
+>>> print(source(secp256r1).splitlines()[0])
+# Generated for secp256r1: a = -3
+>>> import inspect
+>>> inspect.getsource(formulas(secp256r1).double).splitlines()[0]
+'def double(X1, Y1, Z1):'
+"""
+
+import linecache
+import types
+
+_cache = {}
+
+WEIERSTRASS = '''\
+# Generated for {name}: a = {a_desc}
+def double(X1, Y1, Z1):
+    YY = Y1 * Y1 % {p}
+    ZZ = Z1 * Z1 % {p}
+    YZ = Y1 * Z1 % {p}
+    YYZ = YY * Z1 % {p}
+    w = {w}
+    ww = w * w % {p}
+    www = w * ww % {p}
+    X3 = 2 * YZ * ((ww - 8 * X1 * YYZ) % {p}) % {p}
+    Y3 = (4 * YYZ * ((3 * w * X1 - 2 * YYZ) % {p}) - www) % {p}
+    Z3 = 8 * YYZ * ZZ % {p} * Y1 % {p}
+    return X3, Y3, Z3
+
+
+def add(X1, Y1, Z1, X2, Y2, Z2):
+    u = (Y2 * Z1 - Y1 * Z2) % {p}
+    v = (X2 * Z1 - X1 * Z2) % {p}
+    if v == 0:
+        if u != 0:
+            return 0, 1, 0
+        return double(X1, Y1, Z1)
+
+    uu = u * u % {p}
+    uuu = u * uu % {p}
+    vv = v * v % {p}
+    vvv = v * vv % {p}
+    X1vv = X1 * vv % {p}
+    X3 = v * ((Z2 * ((Z1 * uu - 2 * X1vv) % {p}) - vvv) % {p}) % {p}
+    Y3 = (3 * u * X1vv - Y1 * vvv - Z1 * uuu) % {p}
+    Y3 = (Z2 * Y3 + u * vvv) % {p}
+    Z3 = vvv * Z1 % {p} * Z2 % {p}
+    return X3, Y3, Z3
+'''
+
+EDWARDS = '''\
+# Generated for {name}: a = {a_desc}
+def double(X1, Y1, Z1, T1):
+    # https://www.hyperelliptic.org/EFD/g1p/auto-twisted-extended.html#doubling-dbl-2008-hwcd
+    A = X1 * X1 % {p}
+    B = Y1 * Y1 % {p}
+    C = 2 * Z1 * Z1 % {p}
+    D = {D}
+    E = ((X1 + Y1) ** 2 - A - B) % {p}
+    G = D + B
+    F = G - C
+    H = D - B
+    return E * F % {p}, G * H % {p}, F * G % {p}, E * H % {p}
+
+
+def add(X1, Y1, Z1, T1, X2, Y2, Z2, T2):
+    if (X2 * Z1 - X1 * Z2) % {p} == 0 and (Y2 * Z1 - Y1 * Z2) % {p} == 0:
+        return double(X1, Y1, Z1, T1)
+
+    # https://www.hyperelliptic.org/EFD/g1p/auto-twisted-extended.html#addition-add-2008-hwcd-2
+    A = X1 * X2 % {p}
+    B = Y1 * Y2 % {p}
+    C = Z1 * T2 % {p}
+    D = T1 * Z2 % {p}
+    E = D + C
+    F = ((X1 - Y1) * (X2 + Y2) + B - A) % {p}
+    G = {G}
+    H = D - C
+    return E * F % {p}, G * H % {p}, F * G % {p}, E * H % {p}
+'''
+
+
+def weierstrass(cls):
+    "Returns the add() and double() functions of a Weierstrass curve"
+    # The context is not used: building it reads the tuning file, which
+    # should not happen when a curve module is imported.
+    a = cls.a % cls.prime
+    if a == cls.prime - 3:
+        parts = {"a_desc": "-3", "w": "3 * (X1 - Z1) * (X1 + Z1) % {p}"}
+    elif a == 0:
+        parts = {"a_desc": "0", "w": "3 * X1 * X1 % {p}"}
+    else:
+        parts = {"a_desc": "%#x" % cls.a,
+                 "w": "(3 * X1 * X1 + %d * ZZ) %% {p}" % cls.a}
+    return _build(cls, WEIERSTRASS, parts)
+
+
+def edwards(cls):
+    "Returns the add() and double() functions of a twisted Edwards curve"
+    a = cls.a % cls.prime
+    if a == cls.prime - 1:
+        parts = {"a_desc": "-1", "D": "-A", "G": "B - A"}
+    elif a == 1:
+        parts = {"a_desc": "1", "D": "A", "G": "B + A"}
+    else:
+        parts = {"a_desc": "%#x" % cls.a, "D": "%d * A %% {p}" % cls.a,
+                 "G": "B + %d * A" % cls.a}
+    return _build(cls, EDWARDS, parts)
+
+
+def source(cls):
+    "Returns the generated source of the curve's formulas"
+    return _cache[cls].source
+
+
+def formulas(cls):
+    "Returns the curve's generated add() and double() functions"
+    return _cache[cls]
+
+
+def _build(cls, template, parts):
+    f = _cache.get(cls)
+    if f is not None:
+        return f
+
+    p = "%d" % cls.prime
+    parts = {k: v.replace("{p}", p) for k, v in parts.items()}
+    text = template.format(name=cls.__name__, p=p, **parts)
+
+    filename = "<rubenesque.curves.codegen %s>" % cls.__name__
+    linecache.cache[filename] = (len(text), None, text.splitlines(True), filename)
+    namespace = {}
+    exec(compile(text, filename, "exec"), namespace)
+
+    f = types.SimpleNamespace(add=namespace["add"], double=namespace["double"],
+                              source=text)
+    return _cache.setdefault(cls, f)
@@ -26,7 +26,8 @@
 
 import abc
 
-from ..math import sqrt, inv
+from ..math import sqrt, inv, inv_many
+from . import codegen
 from .prime import Point
 
 
@@ -34,6 +35,24 @@ class Point(Point):
     a = 1
     d = 1
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Each curve gets its own specialized group law.
+        if cls.order:
+            formulas = codegen.edwards(cls)
+            cls._add_formula = staticmethod(formulas.add)
+            cls._double_formula = staticmethod(formulas.double)
+
+    @classmethod
+    def constants(cls):
+        constants = super().constants()
+        constants.update({
+            "a_one": cls.a % cls.prime == 1,
+            "a_minus1": cls.a % cls.prime == cls.prime - 1,
+        })
+        return constants
+
     @classmethod
     def create(cls, primary, secondary):
         return cls(secondary, primary)
@@ -43,12 +62,33 @@ class Point(Point):
         pp = primary * primary % cls.prime
         a = (pp - 1) % cls.prime
         b = (cls.d * pp % cls.prime - cls.a) % cls.prime
-        s = sqrt(a * inv(b, cls.prime), cls.prime)
+        s = sqrt(a * inv(b, cls.prime), cls.prime, cls.context().sqrt_plan)
         assert s != 0
 
         secondary = s if s & 1 == bit else ((cls.prime - s) % cls.prime)
         return cls(secondary, primary)
 
+    @classmethod
+    def normalize(cls, points):
+        """Converts many points to affine coordinates with a single inversion
+
+        >>> from .cfrg import edwards25519
+        >>> g = edwards25519.generator()
+        >>> g3 = g * 3
+        >>> pts = [g * 2, g3, edwards25519(), g, g3]
+        >>> edwards25519.normalize(pts)
+        >>> pts == [g + g, g + g + g, edwards25519(), g, g + g + g]
+        True
+        """
+        p = cls.prime
+        todo = {id(pt): pt for pt in points if pt.__z not in (0, 1)}
+        todo = list(todo.values())
+        for pt, i in zip(todo, inv_many([pt.__z for pt in todo], p)):
+            pt.__x = pt.__x * i % p
+            pt.__y = pt.__y * i % p
+            pt.__z = 1
+            pt.__t = pt.__x * pt.__y % p
+
     def __init__(self, x=None, y=None, z=1, t=None):
         assert (y is None and x is None) \
             or (y is not None and x is not None)
@@ -66,8 +106,9 @@ class Point(Point):
             return
 
         p = self.__class__.prime
-        self.__x = self.__x * inv(self.__z, p) % p
-        self.__y = self.__y * inv(self.__z, p) % p
+        i = inv(self.__z, p)
+        self.__x = self.__x * i % p
+        self.__y = self.__y * i % p
         self.__z = 1
         self.__t = self.__x * self.__y
 
@@ -120,31 +161,15 @@ class Point(Point):
         if self.is_identity or other.is_identity:
             return self if other.is_identity else other
 
-        p = self.__class__.prime
+        return self.__class__(*self._add_formula(
+            self.__x, self.__y, self.__z, self.__t,
+            other.__x, other.__y, other.__z, other.__t
+        ))
+
+    def double(self):
+        if self.is_identity:
+            return self
 
-        if self == other:
-            # https://www.hyperelliptic.org/EFD/g1p/auto-twisted-extended.html#doubling-dbl-2008-hwcd
-            A = self.__x * self.__x % p
-            B = self.__y * self.__y % p
-            C = 2 * self.__z % p * self.__z % p
-            D = self.__class__.a * A % p
-            E = ((pow((self.__x + self.__y) % p, 2, p) - A) % p - B) % p
-            G = (D + B) % p
-            F = (G - C) % p
-            H = (D - B) % p
-        else:
-            # https://www.hyperelliptic.org/EFD/g1p/auto-twisted-extended.html#addition-add-2008-hwcd-2
-            A = self.__x * other.__x % p
-            B = self.__y * other.__y % p
-            C = self.__z * other.__t % p
-            D = self.__t * other.__z % p
-            E = (D + C) % p
-            F = ((((self.__x - self.__y) % p) * ((other.__x + other.__y) % p) % p + B) % p - A) % p
-            G = (B + self.__class__.a * A % p) % p
-            H = (D - C) % p
-
-        X3 = E * F % p
-        Y3 = G * H % p
-        T3 = E * H % p
-        Z3 = F * G % p
-        return self.__class__(X3, Y3, Z3, T3)
+        return self.__class__(*self._double_formula(
+            self.__x, self.__y, self.__z, self.__t
+        ))
@@ -26,15 +26,29 @@
 
 import abc
 
+from ..math import sqrt_plan
 from .base import Point
 
 
 class Point(Point):
     prime = 1
 
+    @classmethod
+    def constants(cls):
+        bits = (cls.prime - 1).bit_length()
+        constants = super().constants()
+        constants.update({
+            "bits": bits,
+            "field_bytes": (bits + 7) // 8,
+            "field_mask": 2 ** bits - 1,
+            "cfrg_bytes": bits // 8 + 1,
+            "sqrt_plan": sqrt_plan(cls.prime),
+        })
+        return constants
+
     @classmethod
     def bits(cls):
-        return (cls.prime - 1).bit_length()
+        return cls.context().bits
 
     def __neg__(self):
         if self.is_identity:
@@ -190,6 +190,7 @@ class secp256r1(Point):
     order = 0xffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551
     prime = 0xffffffff00000001000000000000000000000000ffffffffffffffffffffffff
     aliases = ("1.2.840.10045.3.1.7", "P256", "P-256")
+    cose = 1
 
     @classmethod
     def generator(cls):
@@ -250,6 +251,7 @@ class secp384r1(Point):
     order = 0xffffffffffffffffffffffffffffffffffffffffffffffffc7634d81f4372ddf581a0db248b0a77aecec196accc52973
     prime = 0xfffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffeffffffff0000000000000000ffffffff
     aliases = ("1.3.132.0.34", "P384", "P-384")
+    cose = 2
 
     @classmethod
     def generator(cls):
@@ -310,6 +312,7 @@ class secp521r1(Point):
     order = 0x000001fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffa51868783bf2f966b7fcc0148f709a5d03bb5c9b8899c47aebb6fb71e91386409
     prime = 0x000001ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff
     aliases = ("1.3.132.0.35", "P521", "P-521")
+    cose = 3
 
     @classmethod
     def generator(cls):
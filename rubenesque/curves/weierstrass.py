@@ -32,7 +32,8 @@ inversions.
 
 import abc
 
-from ..math import sqrt, inv
+from ..math import sqrt, inv, inv_many
+from . import codegen
 from .prime import Point
 
 
@@ -40,20 +41,61 @@ class Point(Point):
     a = 0
     b = 0
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Each curve gets its own specialized group law.
+        if cls.order:
+            formulas = codegen.weierstrass(cls)
+            cls._add_formula = staticmethod(formulas.add)
+            cls._double_formula = staticmethod(formulas.double)
+
+    @classmethod
+    def constants(cls):
+        constants = super().constants()
+        constants.update({
+            "a_zero": cls.a % cls.prime == 0,
+            "a_minus3": cls.a % cls.prime == cls.prime - 3,
+        })
+        return constants
+
     @classmethod
     def __weierstrass(cls, x):
+        if cls.context().a_zero:
+            return (pow(x, 3, cls.prime) + cls.b) % cls.prime
+
         return (pow(x, 3, cls.prime)
                 + cls.a * x % cls.prime
                 + cls.b) % cls.prime
 
     @classmethod
     def recover(cls, primary, bit):
-        s = sqrt(cls.__weierstrass(primary), cls.prime)
+        s = sqrt(cls.__weierstrass(primary), cls.prime, cls.context().sqrt_plan)
         assert s != 0
 
         secondary = s if s & 1 == bit else ((cls.prime - s) % cls.prime)
         return cls(primary, secondary)
 
+    @classmethod
+    def normalize(cls, points):
+        """Converts many points to affine coordinates with a single inversion
+
+        >>> from .sec import secp256r1
+        >>> g = secp256r1.generator()
+        >>> g3 = g * 3
+        >>> pts = [g * 2, g3, secp256r1(), g, g3]
+        >>> secp256r1.normalize(pts)
+        >>> pts == [g + g, g + g + g, secp256r1(), g, g + g + g]
+        True
+        """
+        p = cls.prime
+        todo = {id(pt): pt for pt in points if pt.__z not in (0, 1)}
+        todo = list(todo.values())
+        for pt, i in zip(todo, inv_many([pt.__z for pt in todo], p)):
+            pt.__x = pt.__x * i % p
+            pt.__y = pt.__y * i % p
+            pt.__z = 1
+
     def __init__(self, x=None, y=None, z=1):
         assert (x is None and y is None) \
             or (x is not None and y is not None)
@@ -67,8 +109,9 @@ class Point(Point):
             return
 
         p = self.__class__.prime
-        self.__x = self.__x * inv(self.__z, p) % p
-        self.__y = self.__y * inv(self.__z, p) % p
+        i = inv(self.__z, p)
+        self.__x = self.__x * i % p
+        self.__y = self.__y * i % p
         self.__z = 1
 
     @property
@@ -97,52 +140,20 @@ class Point(Point):
     def __add__(self, other):
         assert isinstance(other, self.__class__)
 
-        p = self.__class__.prime
+        if self.__z == 0 or other.__z == 0:
+            return self if other.__z == 0 else other
+
+        return self.__class__(*self._add_formula(
+            self.__x, self.__y, self.__z, other.__x, other.__y, other.__z
+        ))
+
+    def double(self):
+        if self.__z == 0:
+            return self
 
-        if self.is_identity or other.is_identity:
-            return self if other.is_identity else other
-
-        u = (other.__y * self.__z % p - self.__y * other.__z % p) % p
-        v = (other.__x * self.__z % p - self.__x * other.__z % p) % p
-
-        if u != 0 and v == 0:
-            X3 = 0
-            Y3 = 1
-            Z3 = 0
-
-        elif u == 0 and v == 0:
-            XX = self.__x * self.__x % p
-            YY = self.__y * self.__y % p
-            ZZ = self.__z * self.__z % p
-            YZ = self.__y * self.__z % p
-            YYZ = YY * self.__z % p
-
-            w = (3 * XX % p + self.__class__.a * ZZ % p) % p
-            ww = w * w % p
-            www = w * ww % p
-
-            X3 = (ww - 8 * self.__x % p * YYZ % p) % p
-            X3 = 2 * YZ % p * X3 % p
-            Y3 = (3 * w % p * self.__x % p - 2 * YYZ % p) % p
-            Y3 = (4 * YYZ % p * Y3 % p - www) % p
-            Z3 = 8 * YYZ % p * ZZ % p * self.__y % p
-
-        else:
-            uu = u * u % p
-            uuu = u * uu % p
-            vv = v * v % p
-            vvv = v * vv % p
-
-            X1vv = self.__x * vv % p
-
-            X3 = (self.__z * uu % p - 2 * X1vv % p) % p
-            X3 = v * ((other.__z * X3 % p - vvv) % p) % p
-            Y3 = 3 * u % p * X1vv % p
-            Y3 = ((Y3 - self.__y * vvv % p) % p - self.__z * uuu % p) % p
-            Y3 = (other.__z * Y3 % p + u * vvv % p) % p
-            Z3 = vvv * self.__z % p * other.__z % p
-
-        return self.__class__(X3, Y3, Z3)
+        return self.__class__(*self._double_formula(
+            self.__x, self.__y, self.__z
+        ))
 
     def __eq__(self, other):
         p = self.__class__.prime
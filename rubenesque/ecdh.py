@@ -0,0 +1,94 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Bulk elliptic curve Diffie-Hellman: one private key against many peers.
+
+The shared secret is the primary coordinate (x for Weierstrass curves, y
+for Edwards curves) of the shared point, encoded big-endian to the byte
+length of the field.
+"""
+
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+
+from .lcodec import lenc
+from .codecs import sec
+
+
+def _derive(cls, prv, peers, codec):
+    points = []
+    for peer in peers:
+        try:
+            point = codec.decode(cls, peer) * prv
+        except AssertionError:
+            point = None
+
+        points.append(None if point is None or point.is_identity else point)
+
+    cls.normalize([p for p in points if p is not None])
+
+    l = cls.context().field_bytes
+    return [None if p is None else lenc(p.primary, l) for p in points]
+
+
+def _chunk(cls, prv, peers, codec):
+    return _derive(cls, prv, peers, importlib.import_module(codec))
+
+
+def derive(cls, prv, peers, codec=sec, processes=None, chunksize=1024):
+    """Computes the shared secrets of prv with each of the encoded peers
+
+    Peers are decoded and validated by the codec; the position of each
+    invalid peer holds None in the result. All shared points are normalized
+    with a single inversion.
+
+    If processes is given, batches larger than chunksize are split into
+    chunks of chunksize peers which are processed in a process pool.
+
+    >>> from .curves.sec import secp256r1
+    >>> prv = secp256r1.private_key()
+    >>> keys = [secp256r1.private_key() for i in range(3)]
+    >>> peers = [sec.encode(secp256r1.generator() * k) for k in keys]
+    >>> secrets = derive(secp256r1, prv, peers + [b"\\x02" + b"\\x00" * 31 + b"\\x01", b""])
+    >>> secrets[:3] == [lenc((secp256r1.generator() * prv * k).x, 32) for k in keys]
+    True
+    >>> secrets[3:]
+    [None, None]
+
+    >>> derive(secp256r1, prv, peers, processes=2, chunksize=2) == secrets[:3]
+    True
+    """
+    peers = list(peers)
+
+    if processes is None or len(peers) <= chunksize:
+        return _derive(cls, prv, peers, codec)
+
+    chunks = [peers[i:i + chunksize] for i in range(0, len(peers), chunksize)]
+    with ProcessPoolExecutor(processes) as pool:
+        futures = [pool.submit(_chunk, cls, prv, c, codec.__name__)
+                   for c in chunks]
+        return [s for f in futures for s in f.result()]
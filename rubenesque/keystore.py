@@ -0,0 +1,231 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A file of fixed-width encoded public keys, read through mmap.
+
+The file starts with a 64 byte header followed by one record per key. Each
+record holds an optional fixed-width key ID followed by the SEC1 or CFRG
+encoding of the key. Records may be sorted by key ID or by encoding, which
+allows binary search lookups. Keys are only decoded when accessed and the
+decoded points are kept in a bounded LRU cache, so neither opening nor
+looking up keys reads the whole file.
+"""
+
+import mmap
+import struct
+
+from .codecs import sec, cfrg
+from .curves import find
+from .lru import LRU
+
+MAGIC = b'RBKS'
+VERSION = 1
+
+# Header: magic, version, codec, sort order, key ID length, count, curve
+HEADER = struct.Struct('>4sBBBxHQ32s')
+HEADER_SIZE = 64
+
+SEC_COMPRESSED = 1
+SEC_UNCOMPRESSED = 2
+CFRG = 3
+
+UNSORTED = 0
+SORT_BY_ENCODING = 1
+SORT_BY_ID = 2
+
+
+def _width(curve, codec):
+    l = curve.context().field_bytes
+    return {
+        SEC_COMPRESSED: 1 + l,
+        SEC_UNCOMPRESSED: 1 + 2 * l,
+        CFRG: curve.context().cfrg_bytes,
+    }[codec]
+
+
+def _encode(points, codec):
+    if codec == CFRG:
+        return cfrg.encode_many(points)
+    return sec.encode_many(points, codec == SEC_COMPRESSED)
+
+
+class KeyStore(object):
+    """A memory-mapped, read-only store of public keys
+
+    >>> import os, tempfile
+    >>> from .curves.sec import secp256r1
+    >>> g = secp256r1.generator()
+    >>> pts = [g * i for i in range(1, 6)]
+    >>> ids = [b'k%d' % (5 - i) for i in range(5)]
+
+    >>> path = os.path.join(tempfile.mkdtemp(), 'keys')
+    >>> KeyStore.create(path, pts, ids, sort=SORT_BY_ID)
+    >>> with KeyStore(path) as store:
+    ...     len(store), store.curve.__name__, store[0] == pts[4]
+    ...     store.lookup(b'k3') == pts[2], store.lookup(b'k9')
+    ...     store.find(sec.encode(pts[1])) == 3
+    ...     list(store) == pts[::-1]
+    (5, 'secp256r1', True)
+    (True, None)
+    True
+    True
+
+    >>> KeyStore.create(path, pts, codec=CFRG, sort=SORT_BY_ENCODING)
+    >>> with KeyStore(path) as store:
+    ...     sorted(store.encoding(i) for i in range(len(store))) == [store.encoding(i) for i in range(len(store))]
+    ...     store[store.find(cfrg.encode(pts[3]))] == pts[3]
+    ...     store.keyid(0)
+    True
+    True
+    b''
+    """
+
+    @staticmethod
+    def create(path, points, ids=None, codec=SEC_COMPRESSED, sort=UNSORTED):
+        """Writes the points (and optionally their fixed-width key IDs)
+
+        If sort is SORT_BY_ENCODING or SORT_BY_ID, the records are sorted
+        so that find() or lookup() can use binary search.
+        """
+        points = list(points)
+        assert points
+        curve = points[0].__class__
+
+        ids = [b''] * len(points) if ids is None else list(ids)
+        assert len(ids) == len(points)
+        idlen = len(ids[0])
+        assert all(len(i) == idlen for i in ids)
+        assert sort != SORT_BY_ID or idlen > 0
+
+        width = _width(curve, codec)
+        data = _encode(points, codec)
+        records = [ids[i] + bytes(data[i * width:(i + 1) * width])
+                   for i in range(len(points))]
+
+        if sort == SORT_BY_ENCODING:
+            records.sort(key=lambda r: r[idlen:])
+        elif sort == SORT_BY_ID:
+            records.sort(key=lambda r: r[:idlen])
+
+        header = HEADER.pack(MAGIC, VERSION, codec, sort, idlen, len(points),
+                             curve.__name__.encode('ascii'))
+
+        with open(path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\x00'))
+            for r in records:
+                f.write(r)
+
+    def __init__(self, path, cache=1024):
+        with open(path, 'rb') as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, codec, sort, idlen, count, name = \
+            HEADER.unpack_from(self.__mmap)
+        assert magic == MAGIC and version == VERSION
+
+        self.curve = find(name.rstrip(b'\x00').decode('ascii'))
+        self.codec = codec
+        self.sort = sort
+        self.count = count
+        self.__idlen = idlen
+        self.__width = _width(self.curve, codec)
+        self.__cache = LRU(cache)
+
+        size = HEADER_SIZE + count * (idlen + self.__width)
+        assert len(self.__mmap) >= size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.__mmap.close()
+
+    def __len__(self):
+        return self.count
+
+    def __offset(self, index):
+        if index < 0 or index >= self.count:
+            raise IndexError(index)
+        return HEADER_SIZE + index * (self.__idlen + self.__width)
+
+    def keyid(self, index):
+        "Returns the key ID of the record"
+        o = self.__offset(index)
+        return self.__mmap[o:o + self.__idlen]
+
+    def encoding(self, index):
+        "Returns the encoded key of the record"
+        o = self.__offset(index) + self.__idlen
+        return self.__mmap[o:o + self.__width]
+
+    def __getitem__(self, index):
+        point = self.__cache.get(index)
+        if point is None:
+            data = self.encoding(index)
+            if self.codec == CFRG:
+                point = cfrg.decode(self.curve, data)
+            else:
+                point = sec.decode(self.curve, data)
+            self.__cache[index] = point
+        return point
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def __search(self, key, get):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if get(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo if lo < self.count and get(lo) == key else None
+
+    def find(self, encoding):
+        "Returns the index of the record with the encoding or None"
+        if self.sort == SORT_BY_ENCODING:
+            return self.__search(encoding, self.encoding)
+
+        for i in range(self.count):
+            if self.encoding(i) == encoding:
+                return i
+        return None
+
+    def lookup(self, keyid):
+        "Returns the point with the key ID or None"
+        if self.sort == SORT_BY_ID:
+            i = self.__search(keyid, self.keyid)
+        else:
+            i = next((i for i in range(self.count) if self.keyid(i) == keyid), None)
+
+        return None if i is None else self[i]
@@ -24,12 +24,6 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from binascii import hexlify, unhexlify
-
-
-if not hasattr(__builtins__, "long"):
-    long = int
-
 
 def lenc(v, l, be=True):
     r"""Encode a long integer to bytes.
@@ -43,17 +37,38 @@ def lenc(v, l, be=True):
     >>> lenc(0xff, 2, False)
     b'\xff\x00'
     """
-    fmt = "%%0%dX" % (l * 2)
-    v = unhexlify(fmt % v)
-    return v if be else v[::-1]
+    return v.to_bytes(l, 'big' if be else 'little')
 
 
 def ldec(v, be=True):
-    """Decode a long integer from bytes.
+    """Decode a long integer from bytes or any other buffer.
 
     >>> assert ldec(b'\\xff', True) == 255
     >>> assert ldec(b'\\xff', False) == 255
     >>> assert ldec(b'\\x00\\xff', True) == 255
     >>> assert ldec(b'\\x00\\xff', False) == 65280
+    >>> assert ldec(memoryview(b'\\x00\\xff')[1:], False) == 255
+    """
+    return int.from_bytes(v, 'big' if be else 'little')
+
+
+def lenc_into(v, l, buf, offset=0, be=True):
+    r"""Encode a long integer into a writable buffer at the given offset.
+
+    >>> buf = bytearray(4)
+    >>> lenc_into(0xff, 2, buf, 1)
+    >>> lenc_into(0xff, 1, memoryview(buf)[3:], 0, False)
+    >>> bytes(buf)
+    b'\x00\x00\xff\xff'
+    """
+    buf[offset:offset + l] = v.to_bytes(l, 'big' if be else 'little')
+
+
+def ldec_from(buf, l, offset=0, be=True):
+    """Decode a long integer from a buffer at the given offset without copying.
+
+    >>> assert ldec_from(b'\\x01\\x00\\xff', 2, 1) == 255
+    >>> assert ldec_from(bytearray(b'\\x01\\x00\\xff'), 2, 1, False) == 65280
     """
-    return long(hexlify(v if be else v[::-1]), 16)
+    return int.from_bytes(memoryview(buf)[offset:offset + l],
+                          'big' if be else 'little')
@@ -0,0 +1,145 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRU(object):
+    """A bounded mapping evicting the least recently used entries
+
+    The mapping holds at most maxsize entries. If maxbytes is given, it
+    also holds at most maxbytes as measured by sizeof(key, value). If ttl
+    is given, entries expire ttl seconds (as measured by clock) after they
+    were stored. All operations are thread-safe.
+
+    >>> cache = LRU(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> cache.get('b') is None
+    True
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    >>> cache = LRU(10, 5, lambda k, v: len(v))
+    >>> cache['a'] = 'xx'
+    >>> cache['b'] = 'yyy'
+    >>> cache['c'] = 'z'
+    >>> sorted(cache.keys()), cache.bytes
+    (['b', 'c'], 4)
+
+    >>> now = [0]
+    >>> cache = LRU(10, ttl=5, clock=lambda: now[0])
+    >>> cache['a'] = 1
+    >>> now[0] = 4
+    >>> cache.get('a')
+    1
+    >>> now[0] = 5
+    >>> cache.get('a') is None, len(cache), cache.expired
+    (True, 0, 1)
+    """
+
+    def __init__(self, maxsize=1024, maxbytes=None, sizeof=None, ttl=None,
+                 clock=time.monotonic):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.ttl = ttl
+        self.clock = clock
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.expired = 0
+        self.__lock = threading.Lock()
+        self.__data = OrderedDict()
+        self.__sizes = {}
+        self.__expires = {}
+
+    def __len__(self):
+        return len(self.__data)
+
+    def __contains__(self, key):
+        return key in self.__data
+
+    def keys(self):
+        with self.__lock:
+            return list(self.__data.keys())
+
+    def __remove(self, key):
+        del self.__data[key]
+        self.bytes -= self.__sizes.pop(key, 0)
+        self.__expires.pop(key, None)
+
+    def get(self, key, default=None):
+        "Returns the value for key, marking it as recently used"
+        with self.__lock:
+            try:
+                value = self.__data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if self.ttl is not None and self.__expires[key] <= self.clock():
+                self.__remove(key)
+                self.expired += 1
+                self.misses += 1
+                return default
+
+            self.__data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self.__lock:
+            if self.sizeof is not None:
+                size = self.sizeof(key, value)
+                self.bytes += size - self.__sizes.get(key, 0)
+                self.__sizes[key] = size
+
+            if self.ttl is not None:
+                self.__expires[key] = self.clock() + self.ttl
+
+            self.__data[key] = value
+            self.__data.move_to_end(key)
+
+            while len(self.__data) > self.maxsize or \
+                    (self.maxbytes is not None and self.bytes > self.maxbytes):
+                self.__remove(next(iter(self.__data)))
+                self.evicted += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__data.clear()
+            self.__sizes.clear()
+            self.__expires.clear()
+            self.bytes = 0
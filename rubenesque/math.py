@@ -38,8 +38,41 @@ def legendre(n, p):
     return {0: 0, p - 1: -1}.get(pow(n, (p - 1) // 2, p), 1)
 
 
-def sqrt(n, p):
-    """Compute the square root using Tonelli-Shanks
+def sqrt_plan(p):
+    """Precompute the square root method and constants for the prime p
+
+    >>> sqrt_plan(7)
+    (3, 2)
+    >>> sqrt_plan(13)
+    (5, 2, 8)
+    >>> sqrt_plan(17)
+    (1, 4, 1, 3)
+    """
+    if p % 4 == 3:
+        return (3, (p + 1) // 4)
+
+    if p % 8 == 5:
+        return (5, (p + 3) // 8, pow(2, (p - 1) // 4, p))
+
+    s = 0
+    q = p - 1
+    while q & 1 == 0:
+        q >>= 1
+        s += 1
+
+    z = 2
+    while legendre(z, p) != -1:
+        z += 1
+
+    return (1, s, q, pow(z, q, p))
+
+
+def sqrt(n, p, plan=None):
+    """Compute the square root, or 0 if there is none
+
+    Primes congruent to 3 mod 4 or 5 mod 8 use a single exponentiation;
+    others use Tonelli-Shanks. The plan from sqrt_plan(p) may be passed to
+    avoid recomputing it.
 
     >>> sqrt(0, 13)
     0
@@ -67,45 +100,55 @@ def sqrt(n, p):
     0
     >>> sqrt(12, 13)
     8
+
+    >>> [sqrt(n, 7) for n in range(7)]
+    [0, 1, 4, 0, 2, 0, 0]
+    >>> [sqrt(n, 17) ** 2 % 17 for n in (2, 4, 8, 9, 13, 15, 16)]
+    [2, 4, 8, 9, 13, 15, 16]
+    >>> sqrt(3, 17)
+    0
     """
-    if legendre(n, p) != 1:
-        return 0
-    if n == 0:
-        return 0
     if p == 2:
-        return n
+        return n % 2
 
-    s = 0
-    q = p - 1
-    while q & 1 == 0:
-        q >>= 1
-        s += 1
+    n %= p
+    if plan is None:
+        plan = sqrt_plan(p)
 
-    if s == 1:
-        return pow(n, (p + 1) // 4, p)
+    if plan[0] == 3:
+        r = pow(n, plan[1], p)
+        return r if r * r % p == n else 0
 
-    z = 2
-    while legendre(z, p) != -1:
-        z += 1
+    if plan[0] == 5:
+        r = pow(n, plan[1], p)
+        rr = r * r % p
+        if rr == n:
+            return r
+        if rr == p - n:
+            return r * plan[2] % p
+        return 0
 
+    if legendre(n, p) != 1:
+        return 0
+
+    _, m, q, c = plan
     r = pow(n, (q + 1) // 2, p)
     t = pow(n, q, p)
-    c = pow(z, q, p)
-    m = s
 
-    while True:
-        if t == 1:
-            return r
-        for i in range(m):
-            if pow(t, 2 ** i, p) == 1:
-                b = pow(c, 2 ** (m - i - 1), p)
-                r = r * b % p
-                c = b * b % p
-                t = t * c % p
-                m = i
-                break
+    while t != 1:
+        i = 0
+        tt = t
+        while tt != 1:
+            tt = tt * tt % p
+            i += 1
+
+        b = pow(c, 1 << (m - i - 1), p)
+        r = r * b % p
+        c = b * b % p
+        t = t * c % p
+        m = i
 
-    assert False
+    return r
 
 
 def egcd(a, b):
@@ -128,3 +171,28 @@ def inv(n, m):
     """
     g, x, y = egcd(n, m)
     return x % m if g == 1 else None
+
+
+def inv_many(values, m):
+    """Calculate many multiplicitive inverses with a single inversion
+
+    This uses Montgomery's trick; all values must be invertible.
+
+    >>> inv_many([7, 3, 5], 13)
+    [2, 9, 8]
+    >>> inv_many([], 13)
+    []
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = acc * v % m
+
+    acc = inv(acc, m)
+    out = [None] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        out[i] = acc * prefix[i] % m
+        acc = acc * values[i] % m
+
+    return out
@@ -0,0 +1,255 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Timing hooks and latency histograms for the library's operations.
+
+A hook is a callable taking (operation, curve name, seconds). While at
+least one hook is registered, the operations listed in
+counters.OPERATIONS (scalar multiplication, codec decoding, ECDSA and
+EdDSA signing and verification, ...) are timed and every hook is called
+after each outermost operation completes. With no hook registered the
+operations are not wrapped at all, so they cost nothing extra.
+
+Recorder is a hook keeping a latency histogram per (operation, curve),
+which can be exported as plain dicts or in the Prometheus text format.
+
+>>> from .curves.sec import secp256r1
+>>> from .codecs import sec
+>>> g = secp256r1.generator()
+
+>>> recorder = enable()
+>>> _ = g * 5
+>>> _ = sec.decode(secp256r1, sec.encode(g))
+>>> disable()
+>>> _ = g * 5
+>>> snapshot = recorder.snapshot()
+>>> sorted(snapshot), snapshot["multiply", "secp256r1"]["count"]
+([('multiply', 'secp256r1'), ('sec.decode', 'secp256r1')], 1)
+>>> print(recorder.prometheus().splitlines()[2].split()[0])
+rubenesque_operation_seconds{operation="multiply",curve="secp256r1",quantile="0.5"}
+
+>>> calls = []
+>>> add_hook(lambda *args: calls.append(args[:2]))
+>>> _ = g * 2
+>>> calls
+[('multiply', 'secp256r1')]
+>>> disable()
+
+Timing and counting can be switched on and off in any order:
+>>> from . import counters
+>>> recorder = enable()
+>>> with counters.counting() as report:
+...     disable()
+...     _ = g * 3
+>>> report["secp256r1", "multiply"]["calls"], recorder.snapshot()
+(1, {})
+>>> hasattr(secp256r1.__mul__, "__wrapped__")
+False
+"""
+
+import functools
+import importlib
+import inspect
+import threading
+import time
+
+from . import patches
+from .counters import OPERATIONS, _curve
+
+# Bits of precision of each histogram bucket: values are recorded with a
+# relative error of at most 2 ** -(SUB_BITS - 1), i.e. about 3%
+SUB_BITS = 6
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+_hooks = []
+_local = threading.local()
+
+
+class Histogram(object):
+    """A log-linear (HDR style) histogram of integer values
+
+    >>> h = Histogram()
+    >>> for v in range(1, 1001):
+    ...     h.record(v * 1000)
+    >>> h.count, h.min, h.max
+    (1000, 1000, 1000000)
+    >>> abs(h.percentile(0.5) - 500000) / 500000 < 0.04
+    True
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def record(self, value):
+        shift = max(value.bit_length() - SUB_BITS, 0)
+        bucket = value >> shift << shift
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q):
+        "Returns the value below which the fraction q of the values lie"
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                shift = max(bucket.bit_length() - SUB_BITS, 0)
+                return min(bucket + (1 << shift) - 1, self.max)
+        return self.max
+
+
+class Recorder(object):
+    "A hook recording a latency histogram (in nanoseconds) per operation"
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__histograms = {}
+
+    def __call__(self, operation, curve, seconds):
+        key = (operation, curve)
+        with self.__lock:
+            histogram = self.__histograms.get(key)
+            if histogram is None:
+                histogram = self.__histograms[key] = Histogram()
+            histogram.record(int(seconds * 1e9))
+
+    def reset(self):
+        with self.__lock:
+            self.__histograms.clear()
+
+    def snapshot(self):
+        """Returns {(operation, curve): summary} with times in seconds
+
+        Each summary holds the count, sum, min, max and QUANTILES.
+        """
+        with self.__lock:
+            snapshot = {}
+            for key, h in self.__histograms.items():
+                snapshot[key] = {
+                    "count": h.count,
+                    "sum": h.sum / 1e9,
+                    "min": h.min / 1e9,
+                    "max": h.max / 1e9,
+                    "quantiles": {q: h.percentile(q) / 1e9 for q in QUANTILES},
+                }
+            return snapshot
+
+    def prometheus(self, name="rubenesque_operation_seconds"):
+        "Returns the snapshot as a summary in the Prometheus text format"
+        lines = [
+            "# HELP %s Latency of rubenesque operations." % name,
+            "# TYPE %s summary" % name,
+        ]
+        for (operation, curve), s in sorted(self.snapshot().items(),
+                                            key=lambda i: tuple(map(str, i[0]))):
+            labels = 'operation="%s",curve="%s"' % (operation, curve or "")
+            for q, v in sorted(s["quantiles"].items()):
+                lines.append('%s{%s,quantile="%s"} %.9g' % (name, labels, q, v))
+            lines.append("%s_sum{%s} %.9g" % (name, labels, s["sum"]))
+            lines.append("%s_count{%s} %d" % (name, labels, s["count"]))
+        return "\n".join(lines) + "\n"
+
+
+def _timed(func, name):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "inside", False):
+            return func(*args, **kwargs)
+
+        _local.inside = True
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _local.inside = False
+            curve = _curve(args)
+            for hook in tuple(_hooks):
+                hook(name, curve, seconds)
+    return wrapper
+
+
+def _wrap(name):
+    def wrap(value):
+        wrapped = _timed(getattr(value, "__func__", value), name)
+        return classmethod(wrapped) if isinstance(value, classmethod) else wrapped
+    return wrap
+
+
+def _install():
+    for module, cls, attr, name in OPERATIONS:
+        owner = importlib.import_module(module)
+        if cls is not None:
+            owner = getattr(owner, cls)
+
+        static = patches.original(owner, attr)
+        if inspect.isgeneratorfunction(getattr(static, "__func__", static)):
+            continue
+
+        patches.patch(__name__, owner, attr, _wrap(name))
+
+
+def _uninstall():
+    patches.unpatch(__name__)
+
+
+def add_hook(hook):
+    "Registers hook(operation, curve, seconds), wrapping the operations"
+    if not _hooks:
+        _install()
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    "Unregisters the hook, unwrapping the operations if it was the last"
+    _hooks.remove(hook)
+    if not _hooks:
+        _uninstall()
+
+
+def enable():
+    "Registers and returns a new Recorder"
+    recorder = Recorder()
+    add_hook(recorder)
+    return recorder
+
+
+def disable():
+    "Unregisters all hooks"
+    del _hooks[:]
+    _uninstall()
@@ -0,0 +1,178 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Shards bulk signing, verification, scalar multiplication and key generation
+across a pool of processes.
+
+Points cross process boundaries as SEC1 encoded bytes rather than pickled
+objects, each worker builds (or loads, see tables.warmup()) its precomputed
+tables once when it starts and results are always returned in input order.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .codecs import sec
+from .curves import find
+from .signatures import ecdsa
+from .tables import warmup
+
+# Most items sent to a worker in a single task
+MAX_CHUNK = 4096
+
+# Tasks queued per worker; more tasks balance the load better, fewer tasks
+# cost less inter-process communication
+TASKS_PER_WORKER = 4
+
+
+def _encode(point):
+    return b'\x00' if point.is_identity else sec.encode(point, False)
+
+
+def _decode(cls, data):
+    return cls() if data == b'\x00' else sec.decode(cls, data)
+
+
+def _warm(names, path=None):
+    warmup([find(name) for name in names], path)
+
+
+def _sign(name, hashes, prv, hashfunc):
+    cls = find(name)
+    return [ecdsa.sign(cls, prv, h, hashfunc=hashfunc) for h in hashes]
+
+
+def _verify(name, items):
+    cls = find(name)
+    results = []
+    for pub, hsh, r, s in items:
+        try:
+            pub = _decode(cls, pub)
+        except AssertionError:
+            results.append(False)
+        else:
+            results.append(ecdsa.verify(pub, hsh, r, s))
+    return results
+
+
+def _multiply(name, items):
+    cls = find(name)
+    points = [_decode(cls, p) * k for p, k in items]
+    cls.normalize(points)
+    return [_encode(p) for p in points]
+
+
+def _keygen(name, counts):
+    cls = find(name)
+    prvs = [cls.private_key() for c in counts for i in range(c)]
+    pubs = [cls.base_multiply(k) for k in prvs]
+    cls.normalize(pubs)
+    return [(k, _encode(p)) for k, p in zip(prvs, pubs)]
+
+
+class Engine(object):
+    """A pool of worker processes for bulk operations on a single curve
+
+    >>> from hashlib import sha256
+    >>> from .curves.sec import secp256r1
+    >>> prv = secp256r1.private_key()
+    >>> pub = secp256r1.generator() * prv
+    >>> hashes = [sha256(b'%d' % i).digest() for i in range(5)]
+
+    >>> import tempfile
+    >>> with Engine(secp256r1, workers=2, tables=tempfile.mkdtemp()) as engine:
+    ...     sigs = engine.sign(prv, hashes, sha256)
+    ...     ok = engine.verify([(pub, h, r, s) for h, (r, s) in zip(hashes, sigs)])
+    ...     bad = engine.verify([(pub, hashes[0], r, s) for r, s in sigs[1:]])
+    ...     pts = engine.multiply([pub, secp256r1()], [3, 3])
+    ...     keys = engine.keygen(7)
+    >>> sigs == [ecdsa.sign(secp256r1, prv, h, hashfunc=sha256) for h in hashes]
+    True
+    >>> ok, bad
+    ([True, True, True, True, True], [False, False, False, False])
+    >>> pts == [pub * 3, secp256r1()]
+    True
+    >>> len(keys), all(secp256r1.generator() * k == p for k, p in keys)
+    (7, True)
+    """
+
+    def __init__(self, cls, workers=None, tables=None):
+        "If tables is a directory, workers load their tables from it"
+        self.curve = cls
+        self.workers = workers or os.cpu_count() or 1
+        if tables is not None:
+            warmup([cls], tables)
+
+        self.__pool = ProcessPoolExecutor(
+            self.workers, initializer=_warm,
+            initargs=((cls.__name__,), tables)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        "Shuts down the worker processes"
+        self.__pool.shutdown()
+
+    def __map(self, fn, items, *args):
+        tasks = self.workers * TASKS_PER_WORKER
+        size = min(MAX_CHUNK, max(1, (len(items) + tasks - 1) // tasks))
+
+        futures = [
+            self.__pool.submit(fn, self.curve.__name__, items[i:i + size], *args)
+            for i in range(0, len(items), size)
+        ]
+        return [r for f in futures for r in f.result()]
+
+    def __encode(self, points):
+        points = list(points)
+        self.curve.normalize(points)
+        return [_encode(p) for p in points]
+
+    def sign(self, prv, hashes, hashfunc=None):
+        "Signs each hash with ecdsa.sign(); returns a list of (r, s)"
+        return self.__map(_sign, list(hashes), prv, hashfunc)
+
+    def verify(self, items):
+        "Verifies each (pub, hsh, r, s) with ecdsa.verify(); returns bools"
+        items = list(items)
+        pubs = self.__encode(i[0] for i in items)
+        return self.__map(_verify, [(p,) + tuple(i[1:]) for p, i in zip(pubs, items)])
+
+    def multiply(self, points, scalars):
+        "Multiplies each point by its scalar; returns a list of points"
+        items = list(zip(self.__encode(points), scalars))
+        return [_decode(self.curve, p) for p in self.__map(_multiply, items)]
+
+    def keygen(self, n):
+        "Generates n key pairs; returns a list of (private, public)"
+        pairs = self.__map(_keygen, [1] * n)
+        return [(k, _decode(self.curve, p)) for k, p in pairs]
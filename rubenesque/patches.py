@@ -0,0 +1,85 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A registry of the monkey patches installed by counters and metrics.
+
+Each patch is a wrap(value) function applied to an attribute of a class
+or module, on top of the patches already there. Removing the patches of
+one owner rebuilds the attribute from its original value and the patches
+which remain, so the instrumentations can be enabled and disabled in any
+order.
+
+>>> import types
+>>> ns = types.ModuleType("ns")
+>>> ns.f = lambda: 1
+>>> patch("a", ns, "f", lambda f: lambda: f() + 10)
+>>> patch("b", ns, "f", lambda f: lambda: f() * 2)
+>>> ns.f()
+22
+>>> unpatch("a")
+>>> ns.f()
+2
+>>> unpatch("b")
+>>> ns.f(), ns.f is original(ns, "f"), _layers
+(1, True, {})
+"""
+
+# Maps (owner, name) to the original value and the list of (tag, wrap)
+_layers = {}
+
+
+def original(owner, name):
+    "Returns the value of the attribute before it was patched"
+    layers = _layers.get((owner, name))
+    return vars(owner)[name] if layers is None else layers[0]
+
+
+def patch(tag, owner, name, wrap):
+    "Replaces the attribute by wrap() of its current value"
+    key = (owner, name)
+    if key not in _layers:
+        _layers[key] = (vars(owner)[name], [])
+    _layers[key][1].append((tag, wrap))
+    _apply(key)
+
+
+def unpatch(tag):
+    "Removes the patches installed with the tag, keeping the others"
+    for key, (value, layers) in list(_layers.items()):
+        if any(t == tag for t, wrap in layers):
+            layers[:] = [(t, wrap) for t, wrap in layers if t != tag]
+            _apply(key)
+            if not layers:
+                del _layers[key]
+
+
+def _apply(key):
+    owner, name = key
+    value, layers = _layers[key]
+    for tag, wrap in layers:
+        value = wrap(value)
+    setattr(owner, name, value)
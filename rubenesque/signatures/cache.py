@@ -0,0 +1,133 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+An opt-in cache of signature verification results.
+
+Redelivered messages make the verifiers check the same signatures again and
+again. When enabled, ecdsa.verify() and eddsa.verify() look up their result
+by a digest of the uncompressed public key, the hash (or message) and
+the signature. Successful verifications are always cached; failures are
+cached only if negative is True.
+
+>>> from . import ecdsa
+>>> from ..curves.sec import secp256r1
+>>> prv = secp256r1.private_key()
+>>> pub = secp256r1.generator() * prv
+>>> r, s = ecdsa.sign(secp256r1, prv, b'abc' * 8)
+
+>>> enable(maxsize=16)
+>>> ecdsa.verify(pub, b'abc' * 8, r, s), ecdsa.verify(pub, b'abc' * 8, r, s)
+(True, True)
+>>> ecdsa.verify(pub, b'abd' * 8, r, s), ecdsa.verify(pub, b'abd' * 8, r, s)
+(False, False)
+>>> st = stats()
+>>> st['hits'], st['misses'], st['entries'], st['hit_rate']
+(1, 3, 1, 0.25)
+
+>>> enable(maxsize=16, negative=True)
+>>> ecdsa.verify(pub, b'abd' * 8, r, s), ecdsa.verify(pub, b'abd' * 8, r, s)
+(False, False)
+>>> stats()['hits'], stats()['entries']
+(1, 1)
+
+Points which are not on the curve are rejected before the cache is used:
+>>> bad = secp256r1(pub.x, (pub.y + 2) % secp256r1.prime)
+>>> ecdsa.verify(bad, b'abc' * 8, r, s), ecdsa.verify(pub, b'abc' * 8, r, s)
+(False, True)
+>>> disable()
+"""
+
+from hashlib import sha256
+
+from ..lru import LRU
+
+_cache = None
+_negative = False
+
+
+def enable(maxsize=4096, ttl=None, negative=False):
+    """Enables the cache, discarding any previous one
+
+    At most maxsize results are kept, each for at most ttl seconds if ttl
+    is given. If negative is True, failed verifications are cached too.
+    """
+    global _cache, _negative
+    _cache = LRU(maxsize, ttl=ttl)
+    _negative = negative
+
+
+def disable():
+    "Disables and discards the cache"
+    global _cache
+    _cache = None
+
+
+def stats():
+    "Returns the hits, misses, hit rate, entries, evictions and expirations"
+    cache = _cache
+    if cache is None:
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0, "entries": 0,
+                "evicted": 0, "expired": 0}
+
+    lookups = cache.hits + cache.misses
+    return {
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "hit_rate": cache.hits / lookups if lookups else 0.0,
+        "entries": len(cache),
+        "evicted": cache.evicted,
+        "expired": cache.expired,
+    }
+
+
+def cached(scheme, parts, verify):
+    """Returns verify(), from the cache if it is enabled
+
+    The parts() function returns the byte strings identifying the
+    verification; they are digested with the scheme name to form the key.
+    If parts() raises AssertionError (e.g. the key cannot be encoded), the
+    result is not cached.
+    """
+    cache = _cache
+    if cache is None:
+        return verify()
+
+    try:
+        h = sha256(scheme.encode())
+        for part in parts():
+            h.update(len(part).to_bytes(4, 'big'))
+            h.update(part)
+    except AssertionError:
+        return verify()
+
+    key = h.digest()
+    result = cache.get(key)
+    if result is None:
+        result = verify()
+        if result or _negative:
+            cache[key] = result
+    return result
@@ -24,13 +24,116 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hmac
+
 from ..math import inv
-from ..lcodec import ldec
+from ..lcodec import lenc, ldec
+from ..codecs import sec
 from ..curves import weierstrass
+from . import cache
+
+
+def _rfc6979_key(hashfunc, cls, prv):
+    "The HMAC state of RFC 6979, step (d), before the message hash is added"
+    hlen = hashfunc().digest_size
+    mac = hmac.new(b'\x00' * hlen, b'\x01' * hlen + b'\x00', hashfunc)
+    mac.update(lenc(prv, cls.context().scalar_bytes))
+    return mac
+
+
+class SigningKey(object):
+    """An ECDSA private key which keeps its RFC 6979 setup
 
+    The HMAC state which only depends on the private key is computed once
+    per hash function and kept by the key, so repeated deterministic
+    signing with it skips the setup. Nothing is kept once the key is
+    discarded. A SigningKey can be passed to sign() instead of the private
+    key integer.
 
-def sign(cls, prv, hsh, testk=None):
+    >>> from rubenesque.curves.sec import secp256r1
+    >>> from hashlib import sha256
+    >>> import pickle
+    >>> key = SigningKey(secp256r1)
+    >>> h = sha256(b'abc').digest()
+    >>> sig = sign(secp256r1, key, h, hashfunc=sha256)
+    >>> sig == sign(secp256r1, key.private, h, hashfunc=sha256)
+    True
+    >>> verify(key.public, h, *sig), pickle.loads(pickle.dumps(key)).private == key.private
+    (True, True)
     """
+
+    def __init__(self, cls, prv=None):
+        assert issubclass(cls, weierstrass.Point)
+        self.curve = cls
+        self.private = cls.private_key() if prv is None else prv
+        self.public = cls.base_multiply(self.private)
+        self.__macs = {}
+
+    def __reduce__(self):
+        return (SigningKey, (self.curve, self.private))
+
+    def mac(self, hashfunc):
+        "Returns the RFC 6979 HMAC state of the key for the hash function"
+        mac = self.__macs.get(hashfunc)
+        if mac is None:
+            mac = _rfc6979_key(hashfunc, self.curve, self.private)
+            self.__macs[hashfunc] = mac
+        return mac
+
+
+def _rfc6979(cls, prv, hsh, hashfunc, key=None):
+    """Generates deterministic nonces as described in RFC 6979, section 3.2
+
+    If the SigningKey of prv is given, its HMAC state is reused.
+
+    >>> from rubenesque.curves.sec import secp256r1
+    >>> from hashlib import sha256
+
+    Test values are from RFC 6979, appendix A.2.5:
+    >>> x = 0xC9AFA9D845BA75166B5C215767B1D6934E50C3DB36E89B127B8A622B120F6721
+    >>> k = next(_rfc6979(secp256r1, x, sha256(b'sample').digest(), sha256))
+    >>> k == 0xA6E3C57DD01ABE90086538398355DD4C3B17AA873382B0F24D6129493D8AAD60
+    True
+    """
+    q = cls.order
+    qlen = q.bit_length()
+    rlen = (qlen + 7) // 8
+
+    def bits2int(b):
+        v = ldec(b)
+        return v >> (len(b) * 8 - qlen) if len(b) * 8 > qlen else v
+
+    h1 = lenc(bits2int(hsh) % q, rlen)
+
+    mac = _rfc6979_key(hashfunc, cls, prv) if key is None else key.mac(hashfunc)
+    mac = mac.copy()
+    mac.update(h1)
+    K = mac.digest()
+    V = hmac.new(K, b'\x01' * len(K), hashfunc).digest()
+    K = hmac.new(K, V + b'\x01' + lenc(prv, rlen) + h1, hashfunc).digest()
+    V = hmac.new(K, V, hashfunc).digest()
+
+    while True:
+        T = b''
+        while len(T) * 8 < qlen:
+            V = hmac.new(K, V, hashfunc).digest()
+            T += V
+
+        k = bits2int(T)
+        if k >= 1 and k < q:
+            yield k
+
+        K = hmac.new(K, V + b'\x00', hashfunc).digest()
+        V = hmac.new(K, V, hashfunc).digest()
+
+
+def sign(cls, prv, hsh, testk=None, hashfunc=None):
+    """
+    If hashfunc (i.e. hashlib.sha256) is specified, the nonce is generated
+    deterministically according to RFC 6979 instead of randomly. The
+    resulting signatures are reproducible. Passing a SigningKey as prv
+    reuses its RFC 6979 setup across calls.
+
     Test values are from RFC 4754
 
     >>> from rubenesque.curves.sec import secp256r1, secp384r1, secp521r1
@@ -65,14 +168,40 @@ def sign(cls, prv, hsh, testk=None):
     True
     >>> b == 5028224013397087880963813951950174050813517229556618035427576214486083823861825258909909585187151444995522339222016536225541889721370155815222553876665673312
     True
+
+
+    Test values are from RFC 6979, appendix A.2.5
+    >>> h = sha256(b'sample').digest()
+    >>> x = 0xC9AFA9D845BA75166B5C215767B1D6934E50C3DB36E89B127B8A622B120F6721
+    >>> r, s = sign(secp256r1, x, h, hashfunc=sha256)
+    >>> r == 0xEFD48B2AACB6A8FD1140DD9CD45E81D69D2C877B56AAF991C34D0EA84EAF3716
+    True
+    >>> s == 0xF7CB1C942D657C41D436C7A1B6E29F65F3E900DBB9AFF4064DC4AB2F843ACDA8
+    True
+    >>> sign(secp256r1, x, h, hashfunc=sha256) == (r, s)
+    True
     """
+    key = None
+    if isinstance(prv, SigningKey):
+        assert prv.curve is cls
+        key, prv = prv, prv.private
+
     assert issubclass(cls, weierstrass.Point)
     assert prv >= 1 and prv < cls.order
 
-    z = ldec(hsh) & (2 ** cls.bits() - 1)
+    nonces = None
+    if testk is None and hashfunc is not None:
+        nonces = _rfc6979(cls, prv, hsh, hashfunc, key)
+
+    z = ldec(hsh) & cls.context().field_mask
     while True:
-        k = cls.private_key() if testk is None else testk
-        r = (cls.generator() * k).primary % cls.order
+        if testk is not None:
+            k = testk
+        elif nonces is not None:
+            k = next(nonces)
+        else:
+            k = cls.private_key()
+        r = cls.base_multiply(k).primary % cls.order
         s = inv(k, cls.order) * (z + r * prv % cls.order) % cls.order
         if r != 0 and s != 0:
             return (r, s)
@@ -127,13 +256,22 @@ def verify(pub, hsh, r, s):
     >>> verify(secp521r1.generator() * w, h, 0, s)
     False
     """
-    if not isinstance(pub, weierstrass.Point):
+    # Check the key before the cache: an invalid point may share its
+    # x coordinate (and thus its compressed encoding) with a valid key.
+    if not isinstance(pub, weierstrass.Point) or not pub.is_valid:
         return False
 
-    if not pub.is_valid:
-        return False
+    return cache.cached(
+        "ecdsa",
+        lambda: (pub.__class__.__name__.encode(), sec.encode(pub, False),
+                 hsh, b'%d' % r, b'%d' % s),
+        lambda: _verify(pub, hsh, r, s))
+
 
-    if not (pub * pub.order).is_identity:
+def _verify(pub, hsh, r, s):
+    # verify() has checked that pub is on the curve; on curves of prime
+    # order every such point is in the group.
+    if pub.cofactor != 1 and not (pub * pub.order).is_identity:
         return False
 
     if r < 1 or r >= pub.order:
@@ -142,10 +280,10 @@ def verify(pub, hsh, r, s):
     if s < 1 or s >= pub.order:
         return False
 
-    z = ldec(hsh) & (2 ** pub.bits() - 1)
+    z = ldec(hsh) & pub.context().field_mask
     w = inv(s, pub.order)
     u1 = z * w % pub.order
     u2 = r * w % pub.order
-    p = pub.generator() * u1 + pub * u2
+    p = pub.combine([pub.generator(), pub], [u1, u2])
 
     return r == p.primary
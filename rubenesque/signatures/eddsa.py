@@ -0,0 +1,251 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Implements EdDSA as described in RFC 8032 for the edwards25519 (Ed25519)
+and ed448goldilocks (Ed448) curves.
+"""
+
+import os
+from hashlib import sha512, shake_256
+
+from ..lcodec import lenc, ldec
+from ..codecs import cfrg
+from ..curves import edwards
+from ..curves.cfrg import edwards25519, ed448goldilocks
+from . import cache
+
+
+def _dom2(context):
+    if not context:
+        return b''
+    return b'SigEd25519 no Ed25519 collisions\x00' + lenc(len(context), 1) + context
+
+
+def _dom4(context):
+    return b'SigEd448\x00' + lenc(len(context), 1) + context
+
+
+HASHES = {
+    edwards25519: lambda ctx, data: sha512(_dom2(ctx) + data).digest(),
+    ed448goldilocks: lambda ctx, data: shake_256(_dom4(ctx) + data).digest(114),
+}
+
+EXPANSIONS = {
+    edwards25519: lambda secret: sha512(secret).digest(),
+    ed448goldilocks: lambda secret: shake_256(secret).digest(114),
+}
+
+
+def _size(cls):
+    return cls.context().cfrg_bytes
+
+
+def _hash(cls, context, *data):
+    return ldec(HASHES[cls](context, b''.join(data)), False) % cls.order
+
+
+class SigningKey(object):
+    """An EdDSA private key with its expanded secret scalar and prefix cached
+
+    >>> key = SigningKey(edwards25519)
+    >>> len(key.secret)
+    32
+    >>> key.public == edwards25519.generator() * key.scalar
+    True
+    >>> SigningKey(ed448goldilocks, key.secret)
+    Traceback (most recent call last):
+        ...
+    AssertionError
+    """
+
+    def __init__(self, cls, secret=None):
+        assert cls in EXPANSIONS
+        size = _size(cls)
+
+        if secret is None:
+            secret = os.urandom(size)
+        assert len(secret) == size
+
+        h = EXPANSIONS[cls](secret)
+        n = cls.bits() - 1
+        c = cls.cofactor.bit_length() - 1
+
+        self.curve = cls
+        self.secret = secret
+        self.scalar = ldec(h[:size], False) & ((1 << n) - (1 << c)) | (1 << n)
+        self.prefix = h[size:]
+        self.public = cls.base_multiply(self.scalar)
+        self.encoded = cfrg.encode(self.public)
+
+
+def sign(key, msg, context=b''):
+    """Signs the message with the SigningKey
+
+    Test values are from RFC 8032, section 7
+
+    >>> from binascii import hexlify, unhexlify
+
+    >>> key = SigningKey(edwards25519, unhexlify(b'9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60'))
+    >>> hexlify(key.encoded)
+    b'd75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a'
+    >>> hexlify(sign(key, b''))
+    b'e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b'
+
+    >>> key = SigningKey(edwards25519, unhexlify(b'4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb'))
+    >>> hexlify(key.encoded)
+    b'3d4017c3e843895a92b70aa74d1b7ebc9c982ccf2ec4968cc0cd55f12af4660c'
+    >>> hexlify(sign(key, b'\\x72'))
+    b'92a009a9f0d4cab8720e820b5f642540a2b27b5416503f8fb3762223ebdb69da085ac1e43e15996e458f3613d0f11d8c387b2eaeb4302aeeb00d291612bb0c00'
+
+    >>> key = SigningKey(ed448goldilocks, unhexlify(b'6c82a562cb808d10d632be89c8513ebf6c929f34ddfa8c9f63c9960ef6e348a3528c8a3fcc2f044e39a3fc5b94492f8f032e7549a20098f95b'))
+    >>> hexlify(key.encoded)
+    b'5fd7449b59b461fd2ce787ec616ad46a1da1342485a70e1f8a0ea75d80e96778edf124769b46c7061bd6783df1e50f6cd1fa1abeafe8256180'
+    >>> hexlify(sign(key, b''))
+    b'533a37f6bbe457251f023c0d88f976ae2dfb504a843e34d2074fd823d41a591f2b233f034f628281f2fd7a22ddd47d7828c59bd0a21bfd3980ff0d2028d4b18a9df63e006c5d1c2d345b925d8dc00b4104852db99ac5c7cdda8530a113a0f4dbb61149f05a7363268c71d95808ff2e652600'
+    """
+    cls = key.curve
+
+    r = _hash(cls, context, key.prefix, msg)
+    R = cfrg.encode(cls.base_multiply(r))
+    k = _hash(cls, context, R, key.encoded, msg)
+    S = (r + k * key.scalar) % cls.order
+    return R + lenc(S, _size(cls), False)
+
+
+def _parse(pub, msg, sig, context):
+    "Returns (R, S, k) for a signature or None if it is malformed"
+    cls = pub.__class__
+    if cls not in HASHES or not pub.is_valid:
+        return None
+
+    size = _size(cls)
+    if len(sig) != 2 * size:
+        return None
+
+    S = ldec(sig[size:], False)
+    if S >= cls.order:
+        return None
+
+    try:
+        R = cfrg.decode(cls, sig[:size])
+    except AssertionError:
+        return None
+
+    k = _hash(cls, context, sig[:size], cfrg.encode(pub), msg)
+    return (R, S, k)
+
+
+def verify(pub, msg, sig, context=b''):
+    """Verifies the signature using the cofactored group equation
+
+    >>> key = SigningKey(edwards25519)
+    >>> sig = sign(key, b'abc')
+    >>> verify(key.public, b'abc', sig)
+    True
+    >>> verify(key.public, b'abd', sig)
+    False
+    >>> verify(key.public, b'abc', sig, b'ctx')
+    False
+    >>> verify(key.public, b'abc', sig[:-1])
+    False
+    >>> verify(edwards25519.generator(), b'abc', sig)
+    False
+
+    >>> key = SigningKey(ed448goldilocks)
+    >>> sig = sign(key, b'abc', b'ctx')
+    >>> verify(key.public, b'abc', sig, b'ctx')
+    True
+    >>> verify(key.public, b'abc', sig)
+    False
+    """
+    # As in ecdsa, the key is checked first and cached by both coordinates.
+    if not isinstance(pub, edwards.Point) or not pub.is_valid:
+        return False
+
+    return cache.cached(
+        "eddsa",
+        lambda: (pub.__class__.__name__.encode(), b'%d' % pub.x,
+                 b'%d' % pub.y, context, msg, sig),
+        lambda: _verify(pub, msg, sig, context))
+
+
+def _verify(pub, msg, sig, context):
+    parsed = _parse(pub, msg, sig, context)
+    if parsed is None:
+        return False
+
+    R, S, k = parsed
+    cls = pub.__class__
+    q = cls.combine([cls.generator(), pub], [S, cls.order - k]) - R
+    return (q * cls.cofactor).is_identity
+
+
+def verify_batch(items, context=b''):
+    """Verifies many (pub, msg, sig) tuples at once
+
+    The cofactored group equations are combined with random 128-bit
+    coefficients into a single multi-scalar multiplication. If the batch
+    fails, at least one signature is invalid; use verify() to find it.
+
+    >>> keys = [SigningKey(edwards25519) for i in range(4)]
+    >>> items = [(k.public, b'%d' % i, sign(k, b'%d' % i)) for i, k in enumerate(keys)]
+    >>> verify_batch(items)
+    True
+    >>> verify_batch(items[:3] + [(keys[3].public, b'', items[3][2])])
+    False
+    >>> verify_batch([])
+    True
+    """
+    points = []
+    scalars = []
+    cls = None
+    B = 0
+
+    for pub, msg, sig in items:
+        if not isinstance(pub, edwards.Point):
+            return False
+
+        if cls is None:
+            cls = pub.__class__
+        elif cls is not pub.__class__:
+            return False
+
+        parsed = _parse(pub, msg, sig, context)
+        if parsed is None:
+            return False
+
+        R, S, k = parsed
+        z = ldec(os.urandom(16))
+        B = (B + z * S) % cls.order
+        points.extend((R, pub))
+        scalars.extend((cls.order - z, z * (cls.order - k) % cls.order))
+
+    if cls is None:
+        return True
+
+    q = cls.combine([cls.generator()] + points, [B] + scalars)
+    return (q * cls.cofactor).is_identity
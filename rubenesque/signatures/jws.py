@@ -0,0 +1,211 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Implements JSON Web Signatures (RFC 7515) in compact serialization with the
+ECDSA algorithms of RFC 7518: ES256, ES384 and ES512.
+"""
+
+import base64
+import hashlib
+import json
+import re
+
+from ..lcodec import lenc, ldec_from
+from ..lru import LRU
+from ..codecs.jwk import b64u_enc
+from ..curves.sec import secp256r1, secp384r1, secp521r1
+from . import ecdsa
+
+ALGORITHMS = {
+    "ES256": (secp256r1, hashlib.sha256),
+    "ES384": (secp384r1, hashlib.sha384),
+    "ES512": (secp521r1, hashlib.sha512),
+}
+
+CURVES = {cls: alg for alg, (cls, h) in ALGORITHMS.items()}
+
+# Decoded protected headers, which tokens of a single issuer mostly share
+_headers = LRU(256)
+
+_B64U = re.compile(r"[A-Za-z0-9_-]*")
+
+
+def _b64u_dec(x):
+    """Decodes unpadded base64url strictly, raising ValueError otherwise
+
+    Any other character, padding or nonzero trailing bits would give
+    several encodings of the same bytes and make tokens malleable.
+
+    >>> _b64u_dec("aGk")
+    b'hi'
+    >>> for x in ("aGk!", "aGk=", "aGl", "a"):
+    ...     try:
+    ...         _b64u_dec(x)
+    ...     except ValueError:
+    ...         print("invalid")
+    invalid
+    invalid
+    invalid
+    invalid
+    """
+    if not _B64U.fullmatch(x) or len(x) % 4 == 1:
+        raise ValueError("Invalid base64url")
+
+    value = base64.b64decode(x + "=" * (-len(x) % 4), b"-_", validate=True)
+    if b64u_enc(value) != x:
+        raise ValueError("Invalid base64url")
+    return value
+
+
+def sign(cls, prv, payload, header=None, deterministic=True):
+    """Signs the payload (bytes) and returns a compact JWS
+
+    The algorithm is chosen by the curve. Unless deterministic is False,
+    the nonce is derived from the key and the message (RFC 6979).
+
+    >>> prv = secp256r1.private_key()
+    >>> token = sign(secp256r1, prv, b'{"sub":"joe"}', {"kid": "1"})
+    >>> token == sign(secp256r1, prv, b'{"sub":"joe"}', {"kid": "1"})
+    True
+    >>> verify(secp256r1.generator() * prv, token)
+    b'{"sub":"joe"}'
+    >>> header(token) == {"alg": "ES256", "kid": "1"}
+    True
+    """
+    alg = CURVES[cls]
+    hashfunc = ALGORITHMS[alg][1]
+
+    protected = dict(header or {}, alg=alg)
+    protected = json.dumps(protected, separators=(",", ":"), sort_keys=True)
+    data = b64u_enc(protected.encode("UTF-8")) + "." + b64u_enc(payload)
+
+    hsh = hashfunc(data.encode("ascii")).digest()
+    r, s = ecdsa.sign(cls, prv, hsh, hashfunc=hashfunc if deterministic else None)
+
+    l = cls.context().field_bytes
+    return data + "." + b64u_enc(lenc(r, l) + lenc(s, l))
+
+
+def header(token):
+    """Returns the decoded protected header of a compact JWS
+
+    Decoded headers are cached; callers must not modify them.
+    """
+    encoded = token[:token.index(".")]
+
+    value = _headers.get(encoded)
+    if value is None:
+        value = json.loads(_b64u_dec(encoded).decode("UTF-8"))
+        if not isinstance(value, dict):
+            raise ValueError("Invalid JWS header")
+        _headers[encoded] = value
+    return value
+
+
+def verify(pub, token):
+    """Verifies a compact JWS and returns its payload, or None if invalid
+
+    >>> prv = secp384r1.private_key()
+    >>> token = sign(secp384r1, prv, b'hi')
+    >>> verify(secp384r1.generator() * prv, token)
+    b'hi'
+    >>> verify(secp384r1.generator(), token) is None
+    True
+    >>> verify(secp384r1.generator() * prv, token[:-4] + "AAAA") is None
+    True
+    >>> verify(secp256r1.generator() * prv, token) is None
+    True
+    >>> verify(secp384r1.generator() * prv, "garbage") is None
+    True
+    >>> verify(secp384r1.generator() * prv, token + "!!!!") is None
+    True
+    >>> verify(secp384r1.generator() * prv, token[:-4] + "!!!!" + token[-4:]) is None
+    True
+    >>> verify(secp384r1.generator() * prv, token + "\u00e9") is None
+    True
+    """
+    try:
+        first = token.index(".")
+        second = token.index(".", first + 1)
+        alg = header(token).get("alg")
+        sig = _b64u_dec(token[second + 1:])
+        payload = _b64u_dec(token[first + 1:second])
+        data = memoryview(token.encode("ascii"))[:second]
+    except ValueError:
+        return None
+
+    if alg not in ALGORITHMS:
+        return None
+
+    cls, hashfunc = ALGORITHMS[alg]
+    if pub.__class__ is not cls:
+        return None
+
+    l = cls.context().field_bytes
+    if len(sig) != 2 * l:
+        return None
+
+    hsh = hashfunc(data).digest()
+    r = ldec_from(sig, l)
+    s = ldec_from(sig, l, l)
+    return payload if ecdsa.verify(pub, hsh, r, s) else None
+
+
+class Verifier(object):
+    """Verifies compact JWS tokens against the keys of a jwk.KeySet
+
+    The key is selected by the "kid" header. The key set holds the keys
+    decoded and validated once, indexed by key ID.
+
+    >>> from ..codecs import jwk
+    >>> prv = secp256r1.private_key()
+    >>> pub = jwk.encode(secp256r1.generator() * prv)
+    >>> verifier = Verifier(jwk.KeySet({"keys": [dict(pub, kid="a")]}))
+    >>> tokens = [sign(secp256r1, prv, b'%d' % i, {"kid": "a"}) for i in range(3)]
+    >>> verifier.verify_many(tokens + [sign(secp256r1, prv, b'x', {"kid": "b"})])
+    [b'0', b'1', b'2', None]
+    >>> verifier.verify(sign(secp256r1, prv, b'x', {"kid": ["a"]})) is None
+    True
+    """
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    def verify(self, token):
+        "Verifies the token and returns its payload, or None if invalid"
+        try:
+            kid = header(token).get("kid")
+        except ValueError:
+            return None
+
+        # Any other kid (e.g. a list) names no key and may not be hashable.
+        key = self.keys.get(kid) if isinstance(kid, str) else None
+        return None if key is None else verify(key.public, token)
+
+    def verify_many(self, tokens):
+        "Verifies many tokens; returns a list of payloads (None if invalid)"
+        return [self.verify(t) for t in tokens]
@@ -0,0 +1,212 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Persists the precomputed generator tables used by base_multiply().
+
+A table file starts with a 128 byte header holding the format version, the
+curve, the window width, the table shape and a SHA-256 checksum of the
+records. Each record is the big-endian affine x and y coordinates of one
+multiple, in the order of Point.precompute(). The file is decoded into
+points when it is loaded, so every process keeps its own copy of the table.
+
+The checksum only detects corruption. Every multiple of a loaded table is
+also checked against the generator before the table is used, which is
+cheaper than building the table since no inversion is needed.
+
+Call warmup() at startup: each table is loaded from the directory if a
+valid file exists, and is otherwise built and saved for the next process.
+
+>>> import os, tempfile
+>>> from .curves import base
+>>> from .curves.sec import secp256r1
+>>> path = tempfile.mkdtemp()
+
+>>> warmup([secp256r1], path)
+>>> os.listdir(path)
+['secp256r1-w4.tbl']
+>>> rows = load(secp256r1, os.path.join(path, 'secp256r1-w4.tbl'))
+>>> rows == secp256r1.precompute()
+True
+
+>>> del base._tables[secp256r1]
+>>> warmup([secp256r1], path)
+>>> secp256r1.precompute() == rows, secp256r1.base_multiply(7) == secp256r1.generator() * 7
+(True, True)
+
+>>> with open(os.path.join(path, 'secp256r1-w4.tbl'), 'r+b') as f:
+...     _ = f.seek(HEADER_SIZE + 10)
+...     _ = f.write(b'?')
+>>> load(secp256r1, os.path.join(path, 'secp256r1-w4.tbl')) is None
+True
+
+A valid point with a recomputed checksum is detected too:
+>>> rows = [list(row) for row in secp256r1.precompute()]
+>>> rows[5][3] = rows[5][4]
+>>> _check(secp256r1, rows), _check(secp256r1, secp256r1.precompute())
+(False, True)
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+from .curves import base
+
+MAGIC = b'RBPT'
+VERSION = 1
+
+# Header: magic, version, window, field bytes, rows, curve, checksum
+HEADER = struct.Struct('>4sBBHI32s32s')
+HEADER_SIZE = 128
+
+
+
+def filename(cls):
+    "The file name of the curve's table for the current parameters"
+    return "%s-w%d.tbl" % (cls.__name__, cls.context().fixed_window)
+
+
+def save(cls, path):
+    "Writes the curve's generator table to path, replacing it atomically"
+    rows = cls.precompute()
+    l = cls.context().field_bytes
+
+    records = bytearray()
+    for row in rows:
+        for point in row:
+            records += point.x.to_bytes(l, 'big') + point.y.to_bytes(l, 'big')
+
+    header = HEADER.pack(MAGIC, VERSION, cls.context().fixed_window, l, len(rows),
+                         cls.__name__.encode('ascii'),
+                         hashlib.sha256(records).digest())
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\x00'))
+            f.write(records)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _check(cls, rows):
+    """Checks every multiple of the table against the generator
+
+    Each multiple must be the sum of two multiples already checked, which
+    takes one addition per multiple but no inversion.
+    """
+    if rows[0][0] != cls.generator():
+        return False
+
+    for i, row in enumerate(rows):
+        if i > 0 and row[0] != rows[i - 1][-1] + rows[i - 1][0]:
+            return False
+
+        for j in range(1, len(row)):
+            if row[j] != row[j - 1] + row[0]:
+                return False
+
+    return True
+
+
+def load(cls, path):
+    """Reads the curve's generator table from path
+
+    Returns None if the file is missing, was written for other parameters,
+    fails its checksum or does not match the curve.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    with data:
+        if len(data) < HEADER_SIZE:
+            return None
+
+        magic, version, window, l, count, name, checksum = \
+            HEADER.unpack_from(data)
+
+        w = cls.context().fixed_window
+        cols = (1 << w) - 1
+        size = 2 * l * cols * count
+        if (magic, version, window, name.rstrip(b'\x00')) != \
+                (MAGIC, VERSION, w, cls.__name__.encode('ascii')) \
+                or l != cls.context().field_bytes \
+                or count != (cls.context().order_bits + w - 1) // w \
+                or len(data) != HEADER_SIZE + size:
+            return None
+
+        records = memoryview(data)[HEADER_SIZE:]
+        try:
+            if hashlib.sha256(records).digest() != checksum:
+                return None
+
+            rows = []
+            for i in range(count):
+                row = []
+                for j in range(cols):
+                    o = 2 * l * (i * cols + j)
+                    row.append(cls(int.from_bytes(records[o:o + l], 'big'),
+                                   int.from_bytes(records[o + l:o + 2 * l], 'big')))
+                rows.append(row)
+        finally:
+            records.release()
+
+    if not _check(cls, rows):
+        return None
+
+    return rows
+
+
+def warmup(curves, path=None):
+    """Loads or builds the generator tables of the curves
+
+    If path is a directory, valid tables are loaded from it and missing or
+    invalid ones are built and saved there.
+    """
+    for cls in curves:
+        if path is None:
+            cls.precompute()
+            continue
+
+        name = os.path.join(path, filename(cls))
+        if cls in base._tables:
+            if not os.path.exists(name):
+                save(cls, name)
+            continue
+
+        rows = load(cls, name)
+        if rows is not None:
+            base._tables.setdefault(cls, rows)
+        else:
+            save(cls, name)
@@ -0,0 +1,148 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Moves batches of points between processes through shared memory.
+
+Points are stored as fixed-width SEC1 records in a single shared memory
+block, so a batch of any size crosses a process boundary as a short handle
+instead of one pickled object per point. The identity is stored as a
+record of zeros.
+"""
+
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .codecs import sec
+from .curves import find
+from .lcodec import lenc
+
+
+def _open(name, size):
+    if name is None:
+        return SharedMemory(None, True, size)
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+
+    # Attaching registers the block with the resource tracker, which would
+    # unlink it when this process exits although its creator still uses it.
+    shm = SharedMemory(name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _attach(name, count, compressed, shm):
+    return Batch(find(name), count, compressed, shm)
+
+
+class Batch(object):
+    """A fixed-size array of points backed by shared memory
+
+    >>> import pickle
+    >>> from .curves.sec import secp256r1
+    >>> g = secp256r1.generator()
+    >>> with Batch.share([g, g * 2, secp256r1()]) as batch:
+    ...     with pickle.loads(pickle.dumps(batch)) as other:
+    ...         list(other) == [g, g * 2, secp256r1()]
+    ...     batch[2] = g * 3
+    ...     batch[2] == g * 3
+    True
+    True
+    >>> len(pickle.dumps(batch)) < 128
+    True
+    """
+
+    def __init__(self, cls, count, compressed=False, shm=None):
+        l = cls.context().field_bytes
+
+        self.curve = cls
+        self.count = count
+        self.compressed = compressed
+        self.width = 1 + l * (1 if compressed else 2)
+
+        self.__owner = shm is None
+        self.__shm = _open(shm, max(1, count * self.width))
+
+    @classmethod
+    def share(cls, points, compressed=False):
+        "Creates a batch holding the points"
+        points = list(points)
+        assert points
+
+        curve = points[0].__class__
+        curve.normalize(points)
+
+        batch = cls(curve, len(points), compressed)
+        for i, point in enumerate(points):
+            batch[i] = point
+        return batch
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __reduce__(self):
+        return (_attach, (self.curve.__name__, self.count,
+                          self.compressed, self.__shm.name))
+
+    def __len__(self):
+        return self.count
+
+    def __record(self, index):
+        if index < 0 or index >= self.count:
+            raise IndexError(index)
+        return self.__shm.buf[index * self.width:(index + 1) * self.width]
+
+    def __getitem__(self, index):
+        record = self.__record(index)
+        if record[0] == 0:
+            return self.curve()
+        return sec.decode(self.curve, bytes(record))
+
+    def __setitem__(self, index, point):
+        assert isinstance(point, self.curve)
+        if point.is_identity:
+            self.__record(index)[:] = lenc(0, self.width)
+        else:
+            self.__record(index)[:] = sec.encode(point, self.compressed)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def close(self):
+        "Detaches from the shared memory; the creator also frees it"
+        self.__shm.close()
+        if self.__owner:
+            if sys.version_info < (3, 13):
+                # Batches attached in processes sharing our resource tracker
+                # unregistered the block, but unlink() unregisters it again.
+                resource_tracker.register(self.__shm._name, "shared_memory")
+            self.__shm.unlink()
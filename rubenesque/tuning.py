@@ -0,0 +1,283 @@
+# pylint: disable=line-too-long
+#
+# Copyright (c) 2026, Red Hat, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Tunes the scalar multiplication parameters of each curve for this machine.
+
+The tunable parameters live in each curve's context (see Point.context()):
+
+ * multiply: the strategy of Point.__mul__, "ladder", "window" or "wnaf"
+ * window: the window width of the "window" and "wnaf" strategies
+ * straus_window: the window width of Point.combine() for few terms
+ * pippenger_threshold: the number of terms above which combine() uses
+   buckets (Pippenger) instead of interleaved windows (Straus)
+ * fixed_window: the window width of the base_multiply() tables
+
+Tuned values are read from a JSON file mapping curve names to parameters
+when the first curve context is built: $RUBENESQUE_TUNING if set, otherwise
+$XDG_CONFIG_HOME/rubenesque/tuning.json. Curves, parameters or values missing
+from the file (or invalid) keep their defaults. To tune the curves and write
+the file, run:
+
+    python -m rubenesque.tuning [-o PATH] [CURVE ...]
+
+>>> import json, os, tempfile
+>>> from .curves.sec import secp192r1
+>>> path = os.path.join(tempfile.mkdtemp(), 'tuning.json')
+>>> try:
+...     tuned = autotune([secp192r1], path, repeat=1, sizes=(4, 8))
+...     sorted(json.load(open(path))['secp192r1']) == sorted(PARAMETERS)
+...     secp192r1.context().multiply == tuned['secp192r1']['multiply']
+... finally:
+...     reset(secp192r1)
+True
+True
+>>> secp192r1.context().multiply == settings('secp192r1').get('multiply', 'ladder')
+True
+"""
+
+import os
+import sys
+
+# The parameters and the values autotune() tries for each
+PARAMETERS = {
+    "multiply": ("ladder", "window", "wnaf"),
+    "window": (3, 4, 5, 6),
+    "straus_window": (2, 3, 4, 5, 6),
+    "pippenger_threshold": None,
+    "fixed_window": (2, 3, 4, 5, 6),
+}
+
+
+def path():
+    "Returns the path of the tuning file"
+    if os.environ.get("RUBENESQUE_TUNING"):
+        return os.environ["RUBENESQUE_TUNING"]
+
+    config = os.environ.get("XDG_CONFIG_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(config, "rubenesque", "tuning.json")
+
+
+def _valid(name, value):
+    "Returns whether the value is allowed for the parameter"
+    if name == "pippenger_threshold":
+        return type(value) is int and value >= 0
+
+    candidates = PARAMETERS.get(name, ())
+    return any(type(value) is type(c) and value == c for c in candidates)
+
+
+def load(filename=None):
+    """Reads the tuning file, ignoring it if it is missing or malformed
+
+    Unknown parameters and invalid values are dropped.
+
+    >>> import json, os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'tuning.json')
+    >>> with open(filename, 'w') as f:
+    ...     json.dump({"secp256r1": {"multiply": "wnaf", "window": 1,
+    ...                              "fixed_window": "4", "other": 5,
+    ...                              "pippenger_threshold": 64}}, f)
+    >>> load(filename)
+    {'secp256r1': {'multiply': 'wnaf', 'pippenger_threshold': 64}}
+    """
+    filename = filename or path()
+    if not os.path.exists(filename):
+        return {}
+
+    # Imported here: most processes have no tuning file, and importing json
+    # would take longer than the rest of the curves package.
+    import json
+
+    try:
+        with open(filename) as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(config, dict):
+        return {}
+
+    return {name: {k: v for k, v in params.items() if _valid(k, v)}
+            for name, params in config.items() if isinstance(params, dict)}
+
+
+# The tuning file, read when the first curve context needs it
+_config = None
+
+
+def settings(name):
+    "Returns the tuned parameters of the named curve"
+    global _config
+    if _config is None:
+        _config = load()
+    return dict(_config.get(name, {}))
+
+
+def apply(cls, **params):
+    "Sets the curve's parameters for this process"
+    from .curves import base
+
+    ctx = cls.context()
+    if params.get("fixed_window", ctx.fixed_window) != ctx.fixed_window:
+        base._tables.pop(cls, None)
+
+    for name, value in params.items():
+        assert _valid(name, value)
+        setattr(ctx, name, value)
+
+
+def reset(cls):
+    "Restores the parameters loaded at import (or the defaults)"
+    from .curves import base
+
+    defaults = {"multiply": "ladder", "window": 4,
+                "straus_window": base.STRAUS_WINDOW,
+                "pippenger_threshold": base.PIPPENGER_THRESHOLD,
+                "fixed_window": base.FIXED_WINDOW}
+    defaults.update(settings(cls.__name__))
+    apply(cls, **defaults)
+
+
+def _time(func, repeat):
+    import timeit
+
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat, 1))
+
+
+def _best(cls, name, candidates, func, repeat):
+    "Applies and returns the fastest candidate value of the parameter"
+    times = {}
+    for value in candidates:
+        apply(cls, **{name: value})
+        func()
+        times[value] = _time(func, repeat)
+
+    best = min(times, key=times.get)
+    apply(cls, **{name: best})
+    return best
+
+
+def tune(cls, repeat=3, sizes=(8, 16, 32, 64, 128)):
+    "Benchmarks the candidates on this machine and applies the fastest"
+    import random
+
+    rnd = random.Random(0)
+    g = cls.generator()
+    p = g * rnd.randrange(1, cls.order)
+    k = rnd.randrange(1, cls.order)
+    expected = p * k
+
+    def multiply():
+        assert p * k == expected
+
+    tuned = {}
+    for name in ("multiply", "window"):
+        if name == "window" and tuned["multiply"] == "ladder":
+            tuned[name] = cls.context().window
+            continue
+        candidates = PARAMETERS[name]
+        if name == "multiply":
+            apply(cls, window=4)
+        tuned[name] = _best(cls, name, candidates, multiply, repeat)
+
+    q = g * rnd.randrange(1, cls.order)
+    tuned["straus_window"] = _best(
+        cls, "straus_window", PARAMETERS["straus_window"],
+        lambda: cls.combine([p, q], [k, k + 1]), repeat)
+
+    threshold = 0
+    for n in sizes:
+        points = [p] * n
+        scalars = [rnd.randrange(1, cls.order) for i in range(n)]
+        apply(cls, pippenger_threshold=n)
+        straus = _time(lambda: cls.combine(points, scalars), repeat)
+        apply(cls, pippenger_threshold=n - 1)
+        pippenger = _time(lambda: cls.combine(points, scalars), repeat)
+        if pippenger < straus:
+            break
+        threshold = n
+    tuned["pippenger_threshold"] = threshold
+    apply(cls, pippenger_threshold=threshold)
+
+    tuned["fixed_window"] = _best(
+        cls, "fixed_window", PARAMETERS["fixed_window"],
+        lambda: cls.base_multiply(k), repeat)
+
+    return tuned
+
+
+def autotune(curves=None, filename=None, repeat=3, sizes=(8, 16, 32, 64, 128),
+             out=None):
+    """Tunes the curves (all supported ones by default) and saves the result
+
+    The tuned parameters are merged into the tuning file, which is written
+    to filename (or path()) unless filename is False.
+    """
+    import json
+    from . import curves as _curves
+
+    if curves is None:
+        curves = [_curves.find(name) for name in _curves.supported()]
+
+    tuned = {}
+    for cls in curves:
+        tuned[cls.__name__] = tune(cls, repeat, sizes)
+        if out is not None:
+            print(cls.__name__, json.dumps(tuned[cls.__name__], sort_keys=True),
+                  file=out)
+
+    if filename is not False:
+        filename = filename or path()
+        config = load(filename)
+        config.update(tuned)
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        with open(filename, "w") as f:
+            json.dump(config, f, indent=2, sort_keys=True)
+
+    return tuned
+
+
+def main(argv=None):
+    import argparse
+    from . import curves as _curves
+
+    parser = argparse.ArgumentParser(prog="python -m rubenesque.tuning",
+                                     description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", help="the tuning file to write")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("curves", nargs="*", help="curves (default: all)")
+    args = parser.parse_args(argv)
+
+    curves = [_curves.find(name) for name in args.curves] or None
+    autotune(curves, args.output, args.repeat, out=sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
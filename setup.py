@@ -20,7 +20,7 @@
 # THE SOFTWARE.
 
 import os
-from distutils.core import setup
+from setuptools import setup
 
 
 def read(fname):
@@ -46,13 +46,14 @@ setup(
     ],
     long_description=read('README.md'),
     requires=[],
+    python_requires=">=3.8",
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: BSD License",
         "Operating System :: OS Independent",
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
         "Topic :: Security :: Cryptography"
     ],
 )